@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_RELOAD: bool = False
+    API_WORKERS: int = 1  # Server processes; each runs its own event loop and OpenAI client (ignored with API_RELOAD)
     
     # CORS Configuration
     # Note: GitHub.com is needed because content scripts run in the page context
@@ -30,8 +31,24 @@ class Settings(BaseSettings):
     # Set OPENAI_MODEL to your fine-tuned model, e.g. "ft:gpt-4o-mini:org:model-id:smells"
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-4o-mini"  # Default to base model; override with fine-tuned model in env
-    OPENAI_MAX_TOKENS: int = 1500
+    OPENAI_MAX_TOKENS: int = 512  # The JSON answer is a label list plus a short explanation
     OPENAI_TEMPERATURE: float = 0.0  # Deterministic detection
+    OPENAI_CACHE_SIZE: int = 10000  # Cached analysis results; 0 disables the cache
+    OPENAI_CACHE_TTL: float = 86400.0  # Seconds a cached result stays valid; 0 = never expires
+    OPENAI_CACHE_PATH: Optional[str] = None  # SQLite file for a cache that survives restarts; unset = in-memory
+    # Reuse results for paraphrased requirements at this cosine similarity (unset = disabled)
+    OPENAI_SEMANTIC_CACHE_THRESHOLD: Optional[float] = None
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    OPENAI_SERVICE_TIER: Optional[str] = None  # e.g. "flex"; unset = account default
+    OPENAI_MAX_REQUIREMENT_TOKENS: int = 2000  # Longer requirements are rejected before any API call
+    OPENAI_MAX_CONCURRENCY: int = 32  # Chat completion requests in flight at once
+    OPENAI_RPM: int = 500  # Requests started per minute; keep below the account limit (0 = unlimited)
+    OPENAI_TPM: int = 0  # Tokens requested per minute; keep below the account limit (0 = unlimited)
+    OPENAI_CUSTOM_RULES: Optional[str] = None  # Project-specific detection rules added after the system prompt
+    OPENAI_USE_AIOHTTP: bool = False  # Send chat completions with aiohttp instead of the SDK's httpx client (no 429/5xx retries)
+    OPENAI_STREAM: bool = False  # Stream chat completions through the SDK
+    OPENAI_POOL_SIZE: int = 200  # Maximum HTTP connections to the OpenAI API
+    OPENAI_REWARM_INTERVAL: float = 50.0  # Seconds between connection re-warms while idle; 0 = disabled
     
     # Judge Configuration (LLM-as-Judge for evaluation)
     JUDGE_MODEL: str = "gpt-4o"
@@ -3,6 +3,7 @@ ReqRev FastAPI Main Application
 Provides secure API endpoints for requirement smell analysis.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +11,10 @@ import logging
 
 from api.config import settings
 from api.routers import requirements
+from api.services.analyzer import reset_judge_client
+from llm_service.iso29148_detector import close_detector, get_detector
+from llm_service.openai_client import OpenAIClient, aclose_all
+from llm_service.tokens import load_encoding
 
 
 # Configure logging
@@ -20,6 +25,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def keep_connection_warm(interval: float) -> None:
+    """
+    Re-warm the OpenAI connection while the API is idle.
+    
+    Keeps a live keep-alive connection in the pool during idle periods so
+    the next request does not pay a fresh TLS handshake. Skipped while
+    analyses keep the connection in use.
+    
+    Args:
+        interval: Seconds between warmups
+    """
+    detector = get_detector()
+    while True:
+        await asyncio.sleep(interval)
+        if detector.idle_time() >= interval:
+            await detector.warmup(log_level=logging.DEBUG)
+
+
+async def load_tokenizer() -> None:
+    """
+    Load the tokenizer for the configured model and check the system prompt length.
+    
+    Loading runs in a worker thread, since it may download the encoding;
+    awaiting it before serving keeps the first requests from loading it
+    on the event loop.
+    """
+    await asyncio.to_thread(load_encoding, settings.OPENAI_MODEL)
+    tokens = await asyncio.to_thread(OpenAIClient.system_prompt_tokens)
+    logger.info(f"📝 System prompt: {tokens} tokens")
+    if tokens > OpenAIClient.SYSTEM_PROMPT_TOKEN_BUDGET:
+        logger.warning(
+            f"⚠️  System prompt exceeds its budget of "
+            f"{OpenAIClient.SYSTEM_PROMPT_TOKEN_BUDGET} tokens"
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -32,10 +73,31 @@ async def lifespan(app: FastAPI):
     logger.info(f"📊 Model: {settings.OPENAI_MODEL}")
     logger.info(f"🔒 CORS Origins: {settings.get_cors_origins()}")
     
+    await load_tokenizer()
+    
+    # Open the OpenAI connection in the background so a slow or unreachable
+    # API does not hold up startup
+    background_tasks: list[asyncio.Task] = []
+    if settings.OPENAI_API_KEY:
+        try:
+            detector = get_detector()
+            background_tasks.append(asyncio.create_task(detector.warmup()))
+            if settings.OPENAI_REWARM_INTERVAL > 0:
+                background_tasks.append(asyncio.create_task(
+                    keep_connection_warm(settings.OPENAI_REWARM_INTERVAL)
+                ))
+        except Exception as e:
+            logger.warning(f"⚠️  Could not initialize detector at startup: {str(e)}")
+    
     yield
     
     # Shutdown
     logger.info("👋 Shutting down ReqRev API...")
+    for task in background_tasks:
+        task.cancel()
+    await close_detector()
+    await aclose_all()
+    reset_judge_client()
 
 
 # Create FastAPI application
@@ -96,5 +158,6 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.API_RELOAD,
+        workers=None if settings.API_RELOAD else settings.API_WORKERS,
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -8,7 +8,12 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 import logging
 
-from api.services.analyzer import analyze_requirement, analyze_requirement_with_judge
+from api.services.analyzer import (
+    analyze_requirement,
+    analyze_requirement_with_judge,
+    collect_batch_analysis,
+    submit_batch_analysis
+)
 
 
 logger = logging.getLogger(__name__)
@@ -38,7 +43,7 @@ class AnalyzeRequirementResponse(BaseModel):
     """Response model for requirement analysis."""
     requirement_id: str = Field(..., description="The requirement identifier from the request")
     description: str = Field(..., description="The analyzed requirement text")
-    smells: list[str] = Field(default_factory=list, description="List of detected requirement smells")
+    smells: tuple[str, ...] = Field(default=(), description="List of detected requirement smells")
     explanation: Optional[str] = Field(None, description="Human-readable explanation of the analysis")
     raw_model_output: Optional[Any] = Field(None, description="Raw output from the LLM model")
     
@@ -57,6 +62,37 @@ class AnalyzeRequirementResponse(BaseModel):
     }
 
 
+class BatchSubmitRequest(BaseModel):
+    """Request model for submitting an offline batch analysis."""
+    requirements: list[AnalyzeRequirementRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50_000,
+        description="Requirements to analyze (requirement_id must be unique; at most 50,000, the OpenAI Batch API limit)"
+    )
+
+
+class BatchSubmitResponse(BaseModel):
+    """Response model for a submitted batch analysis."""
+    batch_id: str = Field(..., description="OpenAI batch ID; poll GET /batches/{batch_id} for results")
+
+
+class BatchRequirementResult(BaseModel):
+    """Analysis result for one requirement of a batch."""
+    requirement_id: str = Field(..., description="The requirement identifier from the request")
+    smells: tuple[str, ...] = Field(default=(), description="List of detected requirement smells")
+    explanation: Optional[str] = Field(None, description="Human-readable explanation of the analysis")
+
+
+class BatchResultsResponse(BaseModel):
+    """Response model for batch analysis results."""
+    batch_id: str = Field(..., description="OpenAI batch ID")
+    status: str = Field(..., description="'in_progress' or 'completed'")
+    results: Optional[list[BatchRequirementResult]] = Field(
+        None, description="Results once the batch has completed"
+    )
+
+
 @router.post(
     "/analyze_requirement",
     response_model=AnalyzeRequirementResponse,
@@ -85,7 +121,7 @@ async def analyze_requirement_endpoint(request: AnalyzeRequirementRequest) -> An
         HTTPException: If analysis fails due to configuration or service errors
     """
     try:
-        logger.info(f"Analyzing requirement: {request.requirement_id}")
+        logger.info("Analyzing requirement: %s", request.requirement_id)
         
         # Call the analyzer service
         result = await analyze_requirement(
@@ -93,7 +129,7 @@ async def analyze_requirement_endpoint(request: AnalyzeRequirementRequest) -> An
             description=request.description
         )
         
-        logger.info(f"Analysis complete for {request.requirement_id}: {len(result.smells)} smells detected")
+        logger.info("Analysis complete for %s: %s smells detected", request.requirement_id, len(result.smells))
         
         return AnalyzeRequirementResponse(
             requirement_id=request.requirement_id,
@@ -104,13 +140,13 @@ async def analyze_requirement_endpoint(request: AnalyzeRequirementRequest) -> An
         )
         
     except ValueError as e:
-        logger.error(f"Validation error analyzing {request.requirement_id}: {str(e)}")
+        logger.error("Validation error analyzing %s: %s", request.requirement_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error analyzing {request.requirement_id}: {str(e)}", exc_info=True)
+        logger.error("Error analyzing %s: %s", request.requirement_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze requirement. Please check server logs."
@@ -154,7 +190,7 @@ async def analyze_requirement_with_judge_endpoint(request: AnalyzeRequirementReq
         HTTPException: If analysis fails or judge is not configured
     """
     try:
-        logger.info(f"Analyzing requirement with judge: {request.requirement_id}")
+        logger.info("Analyzing requirement with judge: %s", request.requirement_id)
         
         # Call the analyzer service with judge
         result = await analyze_requirement_with_judge(
@@ -163,9 +199,8 @@ async def analyze_requirement_with_judge_endpoint(request: AnalyzeRequirementReq
         )
         
         logger.info(
-            f"Analysis with judge complete for {request.requirement_id}: "
-            f"{len(result.smells)} smells detected, "
-            f"judge verdict={result.judge_evaluation.verdict}"
+            "Analysis with judge complete for %s: %s smells detected, judge verdict=%s",
+            request.requirement_id, len(result.smells), result.judge_evaluation.verdict.name
         )
         
         # Return the full result including judge evaluation
@@ -176,7 +211,7 @@ async def analyze_requirement_with_judge_endpoint(request: AnalyzeRequirementReq
             "explanation": result.explanation,
             "raw_model_output": result.raw_output,
             "judge_evaluation": {
-                "verdict": result.judge_evaluation.verdict,
+                "verdict": result.judge_evaluation.verdict.name,
                 "score": result.judge_evaluation.score,
                 "justification": result.judge_evaluation.justification,
                 "suggested_corrections": result.judge_evaluation.suggested_corrections,
@@ -185,14 +220,14 @@ async def analyze_requirement_with_judge_endpoint(request: AnalyzeRequirementReq
         }
         
     except ValueError as e:
-        logger.error(f"Validation error analyzing {request.requirement_id}: {str(e)}")
+        logger.error("Validation error analyzing %s: %s", request.requirement_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
         logger.error(
-            f"Error analyzing {request.requirement_id} with judge: {str(e)}", 
+            "Error analyzing %s with judge: %s", request.requirement_id, e,
             exc_info=True
         )
         raise HTTPException(
@@ -201,6 +236,109 @@ async def analyze_requirement_with_judge_endpoint(request: AnalyzeRequirementReq
         )
 
 
+@router.post(
+    "/batches",
+    response_model=BatchSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit requirements for offline batch analysis",
+    description=(
+        "Submits requirements to the OpenAI Batch API, which processes them within "
+        "24 hours at half the price of synchronous analysis. Intended for bulk audits "
+        "of whole documents; poll GET /batches/{batch_id} for the results."
+    )
+)
+async def submit_batch_endpoint(request: BatchSubmitRequest) -> BatchSubmitResponse:
+    """
+    Submit requirements for offline batch analysis.
+    
+    Args:
+        request: The requirements to analyze
+        
+    Returns:
+        The batch ID to poll for results
+        
+    Raises:
+        HTTPException: If the input is invalid or submission fails
+    """
+    try:
+        batch_id = await submit_batch_analysis(
+            [(item.requirement_id, item.description) for item in request.requirements]
+        )
+        return BatchSubmitResponse(batch_id=batch_id)
+        
+    except ValueError as e:
+        logger.error("Validation error submitting batch: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Error submitting batch: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to submit batch. Please check server logs."
+        )
+
+
+@router.get(
+    "/batches/{batch_id}",
+    response_model=BatchResultsResponse,
+    summary="Get batch analysis results",
+    description="Returns the status of a submitted batch, and its results once completed."
+)
+async def get_batch_endpoint(batch_id: str) -> BatchResultsResponse:
+    """
+    Get the status and results of a batch analysis.
+    
+    Args:
+        batch_id: The OpenAI batch ID returned on submission
+        
+    Returns:
+        Batch status, with results once completed
+        
+    Raises:
+        HTTPException: If the batch is unknown, failed, or its results
+            cannot be fetched
+    """
+    try:
+        results = await collect_batch_analysis(batch_id)
+        
+    except LookupError as e:
+        logger.error("Batch %s not found: %s", batch_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except RuntimeError as e:
+        logger.error("Batch %s did not complete: %s", batch_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Error fetching batch %s: %s", batch_id, e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch batch results. Please check server logs."
+        )
+    
+    if results is None:
+        return BatchResultsResponse(batch_id=batch_id, status="in_progress", results=None)
+    
+    return BatchResultsResponse(
+        batch_id=batch_id,
+        status="completed",
+        results=[
+            BatchRequirementResult(
+                requirement_id=requirement_id,
+                smells=result.smells,
+                explanation=result.explanation
+            )
+            for requirement_id, result in results.items()
+        ]
+    )
+
+
 @router.get(
     "/models",
     summary="Get model information",
@@ -4,19 +4,63 @@ Business logic layer for requirement analysis.
 """
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from llm_service.iso29148_detector import get_detector
 from llm_service.models.requirement_smell_result import (
     RequirementSmellResult,
     RequirementAnalysisWithJudgeResult,
-    JudgeEvaluation
+    JudgeEvaluation,
+    Verdict
 )
 from api.config import settings
 
+if TYPE_CHECKING:
+    from llm_service.judge_client import JudgeClient
+
 
 logger = logging.getLogger(__name__)
 
+# Singleton judge client, created on first use
+_judge_client: Optional["JudgeClient"] = None
+
+
+def get_judge_client() -> "JudgeClient":
+    """
+    Get the singleton judge client instance.
+    
+    Reusing one client keeps its connections warm and lets OpenAI's prompt
+    cache serve the judge system prompt across evaluations.
+    
+    Returns:
+        JudgeClient instance
+    """
+    global _judge_client
+    
+    if _judge_client is None:
+        from llm_service.judge_client import JudgeClient
+        
+        _judge_client = JudgeClient(
+            api_key=settings.OPENAI_API_KEY,
+            model=settings.JUDGE_MODEL,
+            max_tokens=settings.JUDGE_MAX_TOKENS,
+            temperature=settings.JUDGE_TEMPERATURE
+        )
+    
+    return _judge_client
+
+
+def reset_judge_client() -> None:
+    """
+    Drop the singleton judge client.
+    
+    Call on shutdown, after the shared OpenAI clients are closed, so a
+    later get_judge_client() does not reuse a closed client.
+    """
+    global _judge_client
+    
+    _judge_client = None
+
 
 async def analyze_requirement(
     requirement_id: str,
@@ -46,8 +90,8 @@ async def analyze_requirement(
     if not description or not description.strip():
         raise ValueError("description cannot be empty")
     
-    logger.info(f"Analyzing requirement {requirement_id}")
-    logger.debug(f"Description: {description[:100]}...")
+    logger.info("Analyzing requirement %s", requirement_id)
+    logger.debug("Description: %.100s...", description)
     
     try:
         # Get the LLM detector instance
@@ -61,20 +105,20 @@ async def analyze_requirement(
         
         # Log results
         logger.info(
-            f"Analysis complete for {requirement_id}: "
-            f"{len(result.smells)} smells detected"
+            "Analysis complete for %s: %s smells detected",
+            requirement_id, len(result.smells)
         )
         
-        if result.smells:
-            logger.debug(f"Detected smells: {', '.join(result.smells)}")
+        if result.smells and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detected smells: %s", ", ".join(result.smells))
         
         return result
         
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Analysis failed for {requirement_id}: {str(e)}", exc_info=True)
+        logger.error("Analysis failed for %s: %s", requirement_id, e, exc_info=True)
         raise
 
 
@@ -107,21 +151,14 @@ async def analyze_requirement_with_judge(
             "LLM_JUDGE_ENABLED=true in your environment."
         )
     
-    logger.info(f"Analyzing requirement {requirement_id} with judge evaluation")
+    logger.info("Analyzing requirement %s with judge evaluation", requirement_id)
     
     # Step 1: Perform base analysis with primary model
     base_result = await analyze_requirement(requirement_id, description)
     
     # Step 2: Evaluate the analysis with judge model
     try:
-        from llm_service.judge_client import JudgeClient
-        
-        judge_client = JudgeClient(
-            api_key=settings.OPENAI_API_KEY,
-            model=settings.JUDGE_MODEL,
-            max_tokens=settings.JUDGE_MAX_TOKENS,
-            temperature=settings.JUDGE_TEMPERATURE
-        )
+        judge_client = get_judge_client()
         
         judge_result = await judge_client.evaluate_requirement_analysis(
             requirement_text=description,
@@ -133,12 +170,12 @@ async def analyze_requirement_with_judge(
         judge_evaluation = JudgeEvaluation(**judge_result)
         
         logger.info(
-            f"Judge evaluation complete for {requirement_id}: "
-            f"verdict={judge_evaluation.verdict}, score={judge_evaluation.score:.2f}"
+            "Judge evaluation complete for %s: verdict=%s, score=%.2f",
+            requirement_id, judge_evaluation.verdict.name, judge_evaluation.score
         )
         
-        # Combine base result with judge evaluation
-        return RequirementAnalysisWithJudgeResult(
+        # Combine base result with judge evaluation (both already validated)
+        return RequirementAnalysisWithJudgeResult.model_construct(
             smells=base_result.smells,
             explanation=base_result.explanation,
             raw_output=base_result.raw_output,
@@ -146,18 +183,18 @@ async def analyze_requirement_with_judge(
         )
         
     except Exception as e:
-        logger.error(f"Judge evaluation failed for {requirement_id}: {str(e)}", exc_info=True)
+        logger.error("Judge evaluation failed for %s: %s", requirement_id, e, exc_info=True)
         # Return a failed evaluation rather than raising
         # This allows the base analysis to still be useful
         failed_evaluation = JudgeEvaluation(
-            verdict="review",
+            verdict=Verdict.review,
             score=0.0,
             justification=f"Judge evaluation failed: {str(e)}",
-            suggested_corrections=[],
+            suggested_corrections=(),
             raw_judge_output={"error": str(e)}
         )
         
-        return RequirementAnalysisWithJudgeResult(
+        return RequirementAnalysisWithJudgeResult.model_construct(
             smells=base_result.smells,
             explanation=base_result.explanation,
             raw_output=base_result.raw_output,
@@ -171,6 +208,9 @@ async def batch_analyze_requirements(
     """
     Analyze multiple requirements in batch.
     
+    Requirements are analyzed concurrently; a failure only affects its
+    own requirement.
+    
     Args:
         requirements: List of (requirement_id, description) tuples
         
@@ -179,17 +219,74 @@ async def batch_analyze_requirements(
     """
     results = {}
     
-    for req_id, description in requirements:
-        try:
-            result = await analyze_requirement(req_id, description)
-            results[req_id] = result
-        except Exception as e:
-            logger.error(f"Failed to analyze {req_id}: {str(e)}")
+    detector = get_detector()
+    outcomes = await detector.analyze_many(
+        [description for _, description in requirements]
+    )
+    
+    for (req_id, _), outcome in zip(requirements, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Failed to analyze %s: %s", req_id, outcome)
             # Store error result
             results[req_id] = RequirementSmellResult(
-                smells=["analysis_error"],
-                explanation=f"Analysis failed: {str(e)}",
+                smells=("analysis_error",),
+                explanation=f"Analysis failed: {str(outcome)}",
                 raw_output=None
             )
+        else:
+            results[req_id] = outcome
     
     return results
+
+
+async def submit_batch_analysis(requirements: list[tuple[str, str]]) -> str:
+    """
+    Submit requirements for offline analysis through the OpenAI Batch API.
+    
+    Batches are processed by OpenAI within 24 hours at half the price of
+    synchronous analysis; fetch the results with collect_batch_analysis().
+    
+    Args:
+        requirements: List of (requirement_id, description) tuples
+        
+    Returns:
+        The OpenAI batch ID
+        
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    if not requirements:
+        raise ValueError("requirements cannot be empty")
+    
+    requirement_ids = [req_id for req_id, _ in requirements]
+    if any(not req_id or not req_id.strip() for req_id in requirement_ids):
+        raise ValueError("requirement_id cannot be empty")
+    if len(set(requirement_ids)) != len(requirement_ids):
+        raise ValueError("requirement_id values must be unique within a batch")
+    
+    detector = get_detector()
+    batch_id = await detector.submit_batch(
+        [description for _, description in requirements],
+        custom_ids=requirement_ids
+    )
+    logger.info("Submitted batch %s with %s requirements", batch_id, len(requirements))
+    return batch_id
+
+
+async def collect_batch_analysis(batch_id: str) -> Optional[dict[str, RequirementSmellResult]]:
+    """
+    Fetch the results of a batch submitted with submit_batch_analysis().
+    
+    Args:
+        batch_id: The OpenAI batch ID
+        
+    Returns:
+        Dictionary mapping requirement_id to RequirementSmellResult, or None
+        while the batch is still running
+        
+    Raises:
+        LookupError: If the batch does not exist or was not submitted here
+        RuntimeError: If the batch failed, expired or was cancelled
+    """
+    detector = get_detector()
+    return await detector.collect_batch(batch_id)
@@ -4,7 +4,7 @@ Uses OpenAI fine-tuned model for requirement smell detection.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
 from api.config import settings
 from llm_service.models.requirement_smell_result import RequirementSmellResult
@@ -39,12 +39,26 @@ class ISO29148Detector:
                 api_key=settings.OPENAI_API_KEY,
                 model=settings.OPENAI_MODEL,
                 max_tokens=settings.OPENAI_MAX_TOKENS,
-                temperature=settings.OPENAI_TEMPERATURE
+                temperature=settings.OPENAI_TEMPERATURE,
+                cache_size=settings.OPENAI_CACHE_SIZE,
+                cache_ttl=settings.OPENAI_CACHE_TTL,
+                cache_path=settings.OPENAI_CACHE_PATH,
+                semantic_cache_threshold=settings.OPENAI_SEMANTIC_CACHE_THRESHOLD,
+                embedding_model=settings.OPENAI_EMBEDDING_MODEL,
+                service_tier=settings.OPENAI_SERVICE_TIER,
+                max_requirement_tokens=settings.OPENAI_MAX_REQUIREMENT_TOKENS,
+                max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+                rpm=settings.OPENAI_RPM,
+                tpm=settings.OPENAI_TPM,
+                use_aiohttp=settings.OPENAI_USE_AIOHTTP,
+                stream=settings.OPENAI_STREAM,
+                pool_size=settings.OPENAI_POOL_SIZE,
+                custom_rules=settings.OPENAI_CUSTOM_RULES
             )
-            logger.info(f"OpenAI client initialized with model: {settings.OPENAI_MODEL}")
+            logger.info("OpenAI client initialized with model: %s", settings.OPENAI_MODEL)
                 
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {str(e)}")
+            logger.error("Failed to initialize OpenAI client: %s", e)
             raise
     
     async def analyze_requirement(
@@ -77,13 +91,117 @@ class ISO29148Detector:
                 timeout=timeout
             )
             
-            logger.info(f"Analysis complete: {len(result.smells)} smells detected")
+            logger.info("Analysis complete: %s smells detected", len(result.smells))
             return result
             
         except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}")
+            logger.error("Analysis failed: %s", e)
             raise
     
+    async def analyze_many(
+        self,
+        requirement_texts: List[str],
+        concurrency: int = 20,
+        timeout: float = 30.0
+    ) -> List[Union[RequirementSmellResult, BaseException]]:
+        """
+        Analyze many requirements concurrently.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            concurrency: Maximum analyses in progress at once
+            timeout: Request timeout in seconds for each requirement
+            
+        Returns:
+            One entry per requirement, in input order: its result, or the
+            exception raised while analyzing it
+            
+        Raises:
+            ValueError: If client not initialized
+        """
+        if not self._client:
+            raise ValueError("LLM client not initialized. Check configuration.")
+        
+        logger.info("Analyzing %s requirements for ISO29148 compliance", len(requirement_texts))
+        
+        return await self._client.analyze_many(
+            requirement_texts=requirement_texts,
+            concurrency=concurrency,
+            timeout=timeout
+        )
+    
+    async def submit_batch(
+        self,
+        requirement_texts: List[str],
+        custom_ids: Optional[List[str]] = None
+    ) -> str:
+        """
+        Submit requirements for offline analysis through the OpenAI Batch API.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            custom_ids: Identifier for each requirement
+            
+        Returns:
+            The OpenAI batch ID
+            
+        Raises:
+            ValueError: If client not initialized or any requirement text is invalid
+        """
+        if not self._client:
+            raise ValueError("LLM client not initialized. Check configuration.")
+        
+        return await self._client.submit_batch(requirement_texts, custom_ids=custom_ids)
+    
+    async def collect_batch(self, batch_id: str) -> Optional[Dict[str, RequirementSmellResult]]:
+        """
+        Fetch the results of a submitted batch if it has finished.
+        
+        Args:
+            batch_id: ID returned by submit_batch()
+            
+        Returns:
+            Results keyed by custom ID, or None while the batch is still running
+            
+        Raises:
+            ValueError: If client not initialized
+            LookupError: If the batch does not exist or was not submitted here
+            RuntimeError: If the batch failed, expired or was cancelled
+        """
+        if not self._client:
+            raise ValueError("LLM client not initialized. Check configuration.")
+        
+        return await self._client.collect_batch(batch_id)
+    
+    async def warmup(self, log_level: int = logging.INFO) -> None:
+        """
+        Warm up the connection to the LLM provider.
+        
+        Failures are logged and ignored; the first analysis will simply
+        open the connection itself.
+        
+        Args:
+            log_level: Level of the success message (e.g. logging.DEBUG for
+                periodic re-warms)
+        """
+        if not self._client:
+            return
+        
+        try:
+            await self._client.warmup()
+            logger.log(log_level, "OpenAI connection warmed up")
+        except Exception as e:
+            logger.warning("OpenAI warmup failed: %s", e)
+    
+    def idle_time(self) -> float:
+        """Seconds since the last request to the LLM provider finished (inf if none has)."""
+        return self._client.idle_time if self._client else float("inf")
+    
+    async def aclose(self) -> None:
+        """Close the client's connections."""
+        if self._client:
+            await self._client.aclose()
+    
     def get_provider_info(self) -> dict:
         """Get information about the current provider configuration."""
         return {
@@ -110,3 +228,17 @@ def get_detector() -> ISO29148Detector:
         _detector_instance = ISO29148Detector()
     
     return _detector_instance
+
+
+async def close_detector() -> None:
+    """
+    Close the singleton detector's connections, if it was created.
+    
+    The singleton is dropped, so a later get_detector() builds a new one
+    instead of reusing closed connections.
+    """
+    global _detector_instance
+    
+    if _detector_instance is not None:
+        detector, _detector_instance = _detector_instance, None
+        await detector.aclose()
@@ -3,12 +3,17 @@ Judge Client
 LLM-as-Judge evaluation using OpenAI models.
 """
 
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
-from openai import AsyncOpenAI
+from typing import Any, ClassVar, Dict, Optional, Sequence
+import orjson
+from openai.types.chat import ChatCompletionSystemMessageParam
+from openai.types.shared_params import ResponseFormatJSONObject
 
+from llm_service.models.requirement_smell_result import Verdict
+from llm_service.openai_client import get_shared_client
 from llm_service.smell_taxonomy import FLAT_SMELL_LABELS, TAXONOMY_TEXT
 
 
@@ -160,6 +165,13 @@ Provide specific, actionable suggestions:
 
 Be precise, objective, and constructive in your evaluation."""
     
+    # Routes evaluations sharing the judge system prompt to the same prompt cache
+    PROMPT_CACHE_KEY = hashlib.sha256(JUDGE_SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:16]
+    
+    # Request parts that never change, built once and shared by every request
+    _SYSTEM_MSG: ClassVar[ChatCompletionSystemMessageParam] = {"role": "system", "content": JUDGE_SYSTEM_PROMPT}
+    _RESP_FMT: ClassVar[ResponseFormatJSONObject] = {"type": "json_object"}
+    
     def __init__(
         self,
         api_key: str,
@@ -178,7 +190,7 @@ Be precise, objective, and constructive in your evaluation."""
             temperature: Sampling temperature (lower = more deterministic)
             timeout: Request timeout in seconds
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_shared_client(api_key)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
@@ -187,7 +199,7 @@ Be precise, objective, and constructive in your evaluation."""
     async def evaluate_requirement_analysis(
         self,
         requirement_text: str,
-        smells: List[str],
+        smells: Sequence[str],
         explanation: Optional[str],
     ) -> Dict[str, Any]:
         """
@@ -201,7 +213,7 @@ Be precise, objective, and constructive in your evaluation."""
         Returns:
             Dictionary with evaluation results (same format as OpenRouter version)
         """
-        logger.info(f"Evaluating analysis with OpenAI model: {self.model}")
+        logger.info("Evaluating analysis with OpenAI model: %s", self.model)
         
         user_prompt = self._build_evaluation_prompt(
             requirement_text=requirement_text,
@@ -212,18 +224,16 @@ Be precise, objective, and constructive in your evaluation."""
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": self.JUDGE_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=[self._SYSTEM_MSG, {"role": "user", "content": user_prompt}],
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                response_format={"type": "json_object"},  # Enforce JSON
+                response_format=self._RESP_FMT,  # Enforce JSON
+                extra_body={"prompt_cache_key": self.PROMPT_CACHE_KEY},
                 timeout=self.timeout
             )
             
             content = response.choices[0].message.content
-            logger.debug(f"OpenAI judge raw response: {content}")
+            logger.debug("OpenAI judge raw response: %s", content)
             
             # Parse JSON response
             evaluation = self._extract_json_from_response(content)
@@ -232,21 +242,26 @@ Be precise, objective, and constructive in your evaluation."""
             normalized = self._normalize_evaluation(evaluation)
             
             # Add raw output
+            usage = response.usage
             normalized["raw_judge_output"] = {
                 "model": self.model,
                 "content": evaluation,
-                "usage": response.usage.model_dump() if response.usage else None
+                "usage": {
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.total_tokens
+                } if usage else None
             }
             
             logger.info(
-                f"Judge evaluation complete: verdict={normalized['verdict']}, "
-                f"score={normalized['score']:.2f}"
+                "Judge evaluation complete: verdict=%s, score=%.2f",
+                normalized["verdict"], normalized["score"]
             )
             
             return normalized
             
         except Exception as e:
-            logger.error(f"OpenAI judge error: {str(e)}", exc_info=True)
+            logger.error("OpenAI judge error: %s", e, exc_info=True)
             raise
     
     def _extract_json_from_response(self, content: str) -> Dict[str, Any]:
@@ -263,7 +278,7 @@ Be precise, objective, and constructive in your evaluation."""
         
         # Try 1: Direct JSON parsing
         try:
-            return json.loads(content_clean)
+            return orjson.loads(content_clean)
         except json.JSONDecodeError:
             pass
         
@@ -274,7 +289,7 @@ Be precise, objective, and constructive in your evaluation."""
             if end != -1:
                 json_str = content_clean[start:end].strip()
                 try:
-                    return json.loads(json_str)
+                    return orjson.loads(json_str)
                 except json.JSONDecodeError:
                     pass
         
@@ -287,7 +302,7 @@ Be precise, objective, and constructive in your evaluation."""
                 lines = lines[:-1]
             json_str = "\n".join(lines).strip()
             try:
-                return json.loads(json_str)
+                return orjson.loads(json_str)
             except json.JSONDecodeError:
                 pass
         
@@ -296,7 +311,7 @@ Be precise, objective, and constructive in your evaluation."""
         matches = re.findall(json_pattern, content_clean, re.DOTALL)
         for match in sorted(matches, key=len, reverse=True):
             try:
-                return json.loads(match)
+                return orjson.loads(match)
             except json.JSONDecodeError:
                 continue
         
@@ -312,7 +327,7 @@ Be precise, objective, and constructive in your evaluation."""
     def _build_evaluation_prompt(
         self,
         requirement_text: str,
-        smells: List[str],
+        smells: Sequence[str],
         explanation: Optional[str]
     ) -> str:
         """Build the evaluation prompt for the judge model."""
@@ -341,9 +356,9 @@ Return your evaluation as a JSON object following the specified schema."""
     
     def _normalize_evaluation(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize and validate judge evaluation output."""
-        verdict = evaluation.get("verdict", "review")
-        if verdict not in ["accept", "review", "reject"]:
-            logger.warning(f"Invalid verdict '{verdict}', defaulting to 'review'")
+        verdict = str(evaluation.get("verdict", "review")).strip().lower()
+        if verdict not in Verdict.__members__:
+            logger.warning("Invalid verdict '%s', defaulting to 'review'", verdict)
             verdict = "review"
         
         score = evaluation.get("score", 0.5)
@@ -351,7 +366,7 @@ Return your evaluation as a JSON object following the specified schema."""
             score = float(score)
             score = max(0.0, min(1.0, score))
         except (TypeError, ValueError):
-            logger.warning(f"Invalid score '{score}', defaulting to 0.5")
+            logger.warning("Invalid score '%s', defaulting to 0.5", score)
             score = 0.5
         
         justification = evaluation.get("justification", "")
@@ -3,12 +3,25 @@ Requirement Smell Result Model
 Data model for LLM analysis results.
 """
 
-from typing import Any, Optional, List, Dict
-try:
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
-from pydantic import BaseModel, Field
+from enum import IntEnum
+from typing import Annotated, Any, Optional, Dict, Tuple
+from pydantic import BaseModel, Field, WithJsonSchema, field_serializer, field_validator
+
+
+class Verdict(IntEnum):
+    """
+    Verdict of an LLM-as-Judge evaluation.
+    
+    Ordered from best to worst so verdicts compare and sort as integers.
+    Serialized by name ("accept", "review", "reject") in API output.
+    """
+    
+    accept = 0
+    review = 1
+    reject = 2
+    
+    def __str__(self) -> str:
+        return self.name
 
 
 class RequirementSmellResult(BaseModel):
@@ -19,8 +32,8 @@ class RequirementSmellResult(BaseModel):
     providing a consistent interface for the API layer.
     """
     
-    smells: List[str] = Field(
-        default_factory=list,
+    smells: Tuple[str, ...] = Field(
+        default=(),
         description="List of detected requirement smells/quality issues"
     )
     
@@ -63,7 +76,11 @@ class JudgeEvaluation(BaseModel):
     performed by the primary model.
     """
     
-    verdict: Literal["accept", "review", "reject"] = Field(
+    # Documented by name to match the wire format, not as the enum's integers
+    verdict: Annotated[
+        Verdict,
+        WithJsonSchema({"type": "string", "enum": list(Verdict.__members__)})
+    ] = Field(
         ...,
         description=(
             "Overall verdict: 'accept' (accurate & complete), "
@@ -84,8 +101,8 @@ class JudgeEvaluation(BaseModel):
         description="Detailed explanation of the evaluation and score"
     )
     
-    suggested_corrections: List[str] = Field(
-        default_factory=list,
+    suggested_corrections: Tuple[str, ...] = Field(
+        default=(),
         description="Specific suggestions for improving the smell detection"
     )
     
@@ -94,6 +111,19 @@ class JudgeEvaluation(BaseModel):
         description="Raw output from the judge model for debugging"
     )
     
+    @field_validator("verdict", mode="before")
+    @classmethod
+    def _coerce_verdict(cls, value: Any) -> Any:
+        """Map verdict names (case-insensitive) onto the Verdict enum."""
+        if isinstance(value, str):
+            return Verdict.__members__.get(value.strip().lower(), value)
+        return value
+    
+    @field_serializer("verdict")
+    def _serialize_verdict(self, verdict: Verdict) -> str:
+        """Serialize the verdict by name to keep the API output unchanged."""
+        return verdict.name
+    
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -137,7 +167,6 @@ class RequirementAnalysisWithJudgeResult(RequirementSmellResult):
                     "explanation": "The requirement uses subjective terms like 'user-friendly' and vague phrases.",
                     "raw_output": {
                         "model": "gpt-4o-mini",
-                        "content": {},
                         "usage": {}
                     },
                     "judge_evaluation": {
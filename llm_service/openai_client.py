@@ -3,125 +3,257 @@ OpenAI Client
 Wrapper for OpenAI Chat API for requirement smell detection.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
-from typing import Optional
-from openai import AsyncOpenAI
+import re
+import string
+import time
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Final, Iterable, List, Mapping, Optional, Tuple, Union
+import aiohttp
+import httpx
+import orjson
+from openai import AsyncOpenAI, NotFoundError
 
 from llm_service.models.requirement_smell_result import RequirementSmellResult
-from llm_service.smell_taxonomy import FLAT_SMELL_LABELS, TAXONOMY_TEXT
+from llm_service.rate_limit import RateLimiter, parse_reset
+from llm_service.response_cache import (
+    InMemoryResponseCache,
+    ResponseCache,
+    SemanticResponseCache,
+    SQLiteResponseCache
+)
+from llm_service.smell_taxonomy import FLAT_SMELL_SET, TAXONOMY_COMPACT
+from llm_service.tokens import count_tokens
 
 
 logger = logging.getLogger(__name__)
 
+# Lower-cases ASCII letters and turns spaces/tabs/hyphens into underscores in one pass
+_CLEAN_TABLE: Final[Dict[int, str]] = str.maketrans({" ": "_", "\t": "_", "-": "_", **{c: c.lower() for c in string.ascii_uppercase}})
 
-class OpenAIClient:
-    """
-    Client for OpenAI Chat Completion API.
-    
-    Uses a fine-tuned model to detect requirement smells based on ISO 29148 standards.
-    Supports comprehensive smell taxonomy across 5 categories:
-    1. Morphological (shape, readability)
-    2. Lexical (word choice, vague/subjective terms)
-    3. Analytical (grammatical mood, structure)
-    4. Relational (dependencies, coupling)
-    5. Incompleteness & language issues
-    """
-    
-    # Build system prompt by concatenating strings (avoid f-string to prevent format errors)
-    SYSTEM_PROMPT = """You are an expert in software requirements engineering and ISO/IEC 29148 standards.
+# Characters stripped from both ends of a cleaned smell name
+_STRIP_CHARS: Final[str] = "`_" + string.whitespace
 
-Your task is to analyze software requirements and detect quality issues (smells) using the fixed taxonomy below.
+# Runs of spaces inside a prompt line
+_INNER_SPACES: Final["re.Pattern[str]"] = re.compile(r" {2,}")
 
-You must detect requirement smells using only the smell IDs listed in this taxonomy.
-Use only these smell IDs in your output; do not invent new labels.
-For each smell that clearly applies, include its ID in the result and briefly justify it.
+# Outermost JSON object in a response that has prose around it
+_JSON_RE: Final["re.Pattern[str]"] = re.compile(r"\{.*\}", re.DOTALL)
 
-""" + TAXONOMY_TEXT + """
+# Map common variations to standard labels
+_SMELL_MAP: Final[Dict[str, str]] = {
+    # Legacy mappings for backward compatibility
+    "ambiguous": "vague_or_implicit_terms",
+    "ambiguity": "vague_or_implicit_terms",
+    "unclear": "vague_or_implicit_terms",
+    "weak_verb": "missing_imperative_verb",
+    "weak_verbs": "missing_imperative_verb",
+    "weak_modal": "conditional_or_non_assertive_requirement",
+    "subjective": "subjective_language",
+    "unmeasurable": "non_verifiable_qualifier",
+    "inconsistent": "excessive_or_insufficient_coupling",
+    "inconsistency": "excessive_or_insufficient_coupling",
+    "vague": "vague_or_implicit_terms",
+    "vagueness": "vague_or_implicit_terms",
+    "incomplete": "incomplete_requirement",
+    "incompleteness": "incomplete_requirement",
+    "missing": "incomplete_requirement",
 
-**DETECTION GUIDELINES:**
+    # Common alternative phrasings
+    "too_long": "too_long_sentence",
+    "too_short": "too_short_sentence",
+    "readability_issue": "unreadable_structure",
+    "acronym_heavy": "acronym_overuse_or_abbrev",
+    "multiple_concerns": "non_atomic_requirement",
+    "compound_requirement": "non_atomic_requirement",
+    "negative": "negative_formulation",
+    "pronoun_ambiguity": "vague_pronoun_or_reference",
+    "vague_terms": "vague_or_implicit_terms",
+    "no_metrics": "non_verifiable_qualifier",
+    "implementation_detail": "design_or_implementation_detail",
+    "how_not_what": "design_or_implementation_detail",
+    "no_action": "missing_imperative_verb",
+    "conditional": "conditional_or_non_assertive_requirement",
+    "passive": "passive_voice",
+    "jargon_heavy": "domain_term_imbalance",
+    "too_many_refs": "too_many_dependencies_or_versions",
+    "missing_info": "incomplete_requirement",
+    "no_unit": "missing_unit_of_measurement",
+    "grammar_error": "language_error_or_grammar_issue",
+}
 
-1. **Implementation Details** (design_or_implementation_detail): 
-   - Flag if mentions: specific technology/protocol names (OAuth 2.0, AES-256), specific vendors (MySQL, AWS), implementation mechanisms (database, cache), technical architecture
-   - ALWAYS FLAG: References to databases, caches, specific algorithms, protocols by name
-   - Example: "validate against database" → flag (mentions "database" = HOW); "validate credentials" → OK (states WHAT)
+_PROMPTS_DIR: Final[Path] = Path(__file__).parent / "prompts"
 
-2. **Vague Terms** (vague_or_implicit_terms): 
-   - Generic nouns like "functionality", "capability", "feature", "information", "data", "system", "process" WITHOUT concrete specifics
-   - Flag ESPECIALLY when these terms are the main object: "provide X functionality", "have X capability"
-   - ALWAYS FLAG: "[verb] functionality/capability/feature" without explaining what specifically
-   - **CRITICAL**: Undefined operational/environmental terms like "normal load", "typical conditions", "regular usage", "standard configuration", "average load", "peak load", "normal operations"
-   - **ALWAYS CHECK**: Any requirement with performance metrics must define the operational context
-   - Example: "backup functionality" → flag (what gets backed up?); "backup user profiles daily" → OK (specific); "under normal load" → **MUST FLAG** (what is normal?); "process 1000 TPS under normal load" → **FLAG vague_or_implicit_terms** for "normal load"
+# Shared AsyncOpenAI clients keyed by API key, so every OpenAIClient and
+# JudgeClient reuses the same connection pool instead of opening its own
+_CLIENTS: Dict[str, AsyncOpenAI] = {}
 
-3. **Broad Quantifiers** (quantifier_without_unit_or_range): 
-   - "all", "any", "every", "each" used without explicit scope boundaries
-   - **CRITICAL**: Flag ONLY when BOTH conditions are met: (1) broad quantifier + (2) vague/ambiguous noun
-   - **FLAG**: "all data" (what data?), "all information" (what information?), "any records" (which records?)
-   - **DO NOT FLAG**: "all user data" when encryption/security context makes it clear (comprehensive coverage intended), "all transactions" in performance context (clear scope)
-   - Must ask: Is the scope genuinely ambiguous, or is it intentionally comprehensive?
-   - Example: "encrypt all user data" → DO NOT FLAG (comprehensive coverage is the point); "backup all data" → FLAG (which data systems/databases?)
 
-4. **Performance Without Context** (non_verifiable_qualifier): 
-   - Time/performance constraints that are truly unverifiable due to missing critical context
-   - **FLAG**: "as soon as possible", "quickly", "high performance" (no metrics at all)
-   - **FLAG**: Performance metrics without ANY context: "within 2 seconds" with NO mention of conditions, environment, or triggers
-   - **DO NOT FLAG**: "within X seconds" when the requirement already provides sufficient context through trigger conditions or environmental description
-   - Example: "When user clicks login... within 2 seconds" → DO NOT FLAG (trigger provides context); "Response time: 2 seconds" alone → FLAG (missing all context)
+def get_shared_client(api_key: str, pool_size: int = 200) -> AsyncOpenAI:
+    """
+    Get the process-wide AsyncOpenAI client for an API key.
+    
+    The client speaks HTTP/2, so concurrent requests are multiplexed over
+    a few kept-alive connections instead of each paying a TCP/TLS handshake.
+    
+    Args:
+        api_key: OpenAI API key
+        pool_size: Maximum connections in the pool; only used by the call
+            that creates the client for this key
+        
+    Returns:
+        AsyncOpenAI client backed by a shared, keep-alive connection pool;
+        a client closed by aclose_all() is replaced with a new one
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None or client.is_closed():
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=max(pool_size // 2, 1),
+                    keepalive_expiry=60.0
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+        _CLIENTS[api_key] = client
+    return client
 
-5. **Open-Ended Bounds** (loophole_or_open_ended):
-   - **CRITICAL**: ALWAYS check for unbounded quantifiers in performance/capacity requirements
-   - **FLAG**: "at least X" (no upper bound), "up to X" (no lower bound), "minimum of X" (no maximum), "maximum of X" (no minimum) when bounds matter
-   - **ESPECIALLY FLAG**: Performance metrics with "at least" - this creates ambiguity about upper limits
-   - Example: "at least 1000 TPS" → **MUST FLAG** (what's the upper limit?); "between 1000-5000 TPS" → OK (bounded); "support a minimum of 100 users" → FLAG (what's the maximum?)
 
-6. **Missing System Response** (missing_system_response):
-   - Requirement describes error/failure conditions but not success conditions, or vice versa
-   - **CHECK**: If requirement mentions "if X fails" or "if validation fails", ensure it also describes what happens on success
-   - Example: "display error if validation fails" → CHECK: does it say what happens on success? If not, FLAG
+async def aclose_all() -> None:
+    """Close all shared AsyncOpenAI clients (call on application shutdown)."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.close()
 
-7. **Incomplete Requirements** (incomplete_requirement):
-   - Missing critical details: WHAT specifically, WHO (actor), WHEN (trigger), WHERE (scope)
-   - Too vague to implement without major assumptions
-   - Example: "provide backup" → flag (backup what? when?); "backup database nightly at 2am" → OK (complete)
 
-8. **Multiple Smells**: A single requirement can have multiple smells. Systematically check ALL categories and detect ALL that apply.
+def _compact_prompt(prompt: str) -> str:
+    """
+    Compact a prompt's whitespace to reduce the tokens sent with every request.
+    
+    Drops trailing whitespace, repeated inner spaces and runs of blank
+    lines; the wording and markdown emphasis are kept. The result is
+    deterministic, so accidental whitespace edits cannot silently
+    invalidate OpenAI's prompt cache.
+    """
+    lines: List[str] = []
+    for line in prompt.strip().splitlines():
+        indent = line[:len(line) - len(line.lstrip())]
+        line = indent + _INNER_SPACES.sub(" ", line.strip())
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    return "\n".join(lines)
 
-**INSTRUCTIONS:**
-Analyze the requirement and return a JSON object with:
-{
-  "smells": ["list", "of", "detected", "smell_labels"],
-  "explanation": "Brief explanation of why these smells were detected"
-}
 
-**IMPORTANT RULES:**
-- Each smell in the list must be one of the exact labels above
-- Return multiple smells if multiple issues exist
-- If no smells detected: {"smells": [], "explanation": "No quality issues detected"}
-- Be thorough: Check ALL categories systematically for EVERY requirement
-- **Check for multiple smells**: A requirement can have 2-3+ smells
+@functools.lru_cache(maxsize=None)
+def _read_prompt(name: str) -> str:
+    """Read a prompt template from the prompts directory."""
+    return (_PROMPTS_DIR / name).read_text(encoding="utf-8")
 
-**CRITICAL CHECKS (commonly missed):**
-- loophole_or_open_ended: **ALWAYS** scan for "at least", "up to", "minimum of", "maximum of" - these almost always indicate unbounded requirements
-- vague_or_implicit_terms: **ALWAYS** scan for undefined operational terms: "normal load", "typical conditions", "standard configuration", "average usage", "peak load"
-- **Performance requirements**: If you see performance metrics (TPS, response time, throughput), CHECK FOR BOTH:
-  1. loophole_or_open_ended: "at least X" without upper bound
-  2. vague_or_implicit_terms: "normal load" or similar undefined context
 
-**CONTEXTUAL RULES:**
-- conditional_or_non_assertive_requirement: ONLY flag if weak modals (may/might/could/should/maybe) are used, OR if complex nested if-then logic obscures the obligation. DO NOT flag simple conditional requirements with clear "shall" statements (e.g., "When X, the system shall Y" is fine).
-- non_atomic_requirement: ONLY flag if multiple DISTINCT concerns/actions that should be tested separately. A single action with multiple details is acceptable.
-- quantifier_without_unit_or_range: Flag ONLY when scope is genuinely ambiguous. "all user data" in encryption context → DO NOT FLAG (comprehensive is intentional)
-- non_verifiable_qualifier: Context matters! "within X seconds" with a trigger/condition → DO NOT FLAG (context is implicit in the scenario)
+def load_prompt(name: str, **values: str) -> str:
+    """
+    Load and compact a prompt template from llm_service/prompts.
+    
+    Args:
+        name: File name of the template
+        **values: Values for the template's $placeholders
+        
+    Returns:
+        The filled-in, compacted prompt
+    """
+    return _compact_prompt(string.Template(_read_prompt(name)).substitute(values))
+
 
-- Be specific and concise in your explanation"""
+class OpenAIClient:
+    """
+    Client for OpenAI Chat Completion API.
+    
+    Uses a fine-tuned model to detect requirement smells based on ISO 29148 standards.
+    Supports comprehensive smell taxonomy across 5 categories:
+    1. Morphological (shape, readability)
+    2. Lexical (word choice, vague/subjective terms)
+    3. Analytical (grammatical mood, structure)
+    4. Relational (dependencies, coupling)
+    5. Incompleteness & language issues
+    """
+    
+    # System prompt, kept in prompts/system_prompt.md with the taxonomy filled in.
+    # The prompt must stay byte-identical across requests so OpenAI's prompt
+    # cache can reuse it: never interpolate per-request data into it. It is
+    # always the first message; configurable rules (custom_rules) go in a
+    # second system message after it, never before or inside it.
+    SYSTEM_PROMPT: ClassVar[str] = load_prompt("system_prompt.md", taxonomy=TAXONOMY_COMPACT)
+    
+    # Token budget for SYSTEM_PROMPT, checked at startup; growing past it
+    # adds to the cost and latency of every request
+    SYSTEM_PROMPT_TOKEN_BUDGET: ClassVar[int] = 3500
+    
+    # Routes requests sharing the system prompt to the same prompt cache
+    PROMPT_CACHE_KEY: ClassVar[str] = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:16]
+    
+    # Responses larger than this (in characters) are parsed off the event loop
+    PARSE_OFFLOAD_THRESHOLD: ClassVar[int] = 16 * 1024
+    
+    # Upper bound (in seconds) for the backoff between batch status checks
+    MAX_BATCH_POLL_INTERVAL: ClassVar[float] = 600.0
+    
+    # OpenAI Batch API limits on the requests and input file size of a batch
+    MAX_BATCH_REQUESTS: ClassVar[int] = 50_000
+    MAX_BATCH_FILE_BYTES: ClassVar[int] = 200 * 1024 * 1024
+    
+    # Metadata tagging the batches this client submits; collect_batch()
+    # only returns batches carrying it
+    BATCH_METADATA: ClassVar[Dict[str, str]] = {"source": "reqrev"}
+    
+    # Requirements shorter than this (in tokens) are flagged locally as
+    # too_short_sentence without calling the API
+    MIN_REQUIREMENT_TOKENS: ClassVar[int] = 3
+    
+    # Tokens of the user message prefix and message framing around the
+    # requirement text, for rate limit estimates
+    USER_PREFIX_TOKENS: ClassVar[int] = 10
+    
+    # User message preamble for analyzing several requirements in one request
+    GROUP_INSTRUCTIONS: ClassVar[str] = (
+        "Analyze each requirement below independently. Return a JSON object "
+        '{"results": [{"id": 1, "smells": [...], "explanation": "..."}, ...]} '
+        "with exactly one entry per requirement, where id is the REQ number."
+    )
+    
+    # Request parts that never change, built once and shared by every request
+    _SYSTEM_MSG: ClassVar[Dict[str, str]] = {"role": "system", "content": SYSTEM_PROMPT}
+    _RESP_FMT: ClassVar[Dict[str, str]] = {"type": "json_object"}
     
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o-mini",
-        max_tokens: int = 1000,
-        temperature: float = 0.0  # Deterministic detection
+        max_tokens: int = 512,
+        temperature: float = 0.0,  # Deterministic detection
+        cache_size: int = 10_000,
+        cache_ttl: Optional[float] = 86_400.0,
+        cache_path: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-3-small",
+        service_tier: Optional[str] = None,
+        use_aiohttp: bool = False,
+        max_requirement_tokens: int = 2000,
+        stream: bool = False,
+        max_concurrency: int = 32,
+        rpm: Optional[int] = 500,
+        tpm: Optional[int] = None,
+        pool_size: int = 200,
+        custom_rules: Optional[str] = None
     ):
         """
         Initialize OpenAI client.
@@ -131,16 +263,133 @@ Analyze the requirement and return a JSON object with:
             model: Model to use (default: gpt-4o-mini)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (lower = more deterministic)
+            cache_size: Maximum number of cached analysis results (0 disables caching)
+            cache_ttl: Seconds a cached result stays valid (None or 0 = never expires)
+            cache_path: SQLite file for a persistent cache of cache_size
+                entries that survives restarts (None = in-memory cache)
+            cache: Custom cache backend; overrides cache_size, cache_ttl and cache_path
+            semantic_cache_threshold: Cosine similarity at which a previously
+                analyzed, similarly worded requirement is reused (None disables
+                the semantic cache)
+            embedding_model: Embedding model used by the semantic cache
+            service_tier: OpenAI service tier for synchronous requests
+                (e.g. "flex" for cheaper, slower processing; None = account default)
+            use_aiohttp: Send chat completions directly with aiohttp instead of
+                the SDK's httpx client (faster at high concurrency, but 429
+                and 5xx responses are not retried)
+            max_requirement_tokens: Longest requirement (in tokens) accepted
+                for analysis; longer texts are rejected before any API call
+            stream: Stream chat completions through the SDK, reading the
+                response as it is generated instead of in one piece (the
+                request timeout still bounds the whole response)
+            max_concurrency: Maximum chat completion requests in flight at once
+            rpm: Maximum chat completion requests started per minute; keep
+                below the account's rate limit (None or 0 = unlimited)
+            tpm: Maximum tokens (prompt plus max_tokens) requested per
+                minute; keep below the account's rate limit (None or 0 =
+                unlimited, the default)
+            pool_size: Maximum HTTP connections to the OpenAI API, shared by
+                all clients using the same API key
+            custom_rules: Project-specific detection rules, sent as a second
+                system message after the fixed system prompt so the prompt
+                cache still covers the fixed part (None = no extra rules)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_shared_client(api_key, pool_size)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.service_tier = service_tier
+        self.use_aiohttp = use_aiohttp
+        self.max_requirement_tokens = max_requirement_tokens
+        self.stream = stream
+        self.custom_rules = (custom_rules or "").strip()
+        self._system_msgs: List[Dict[str, str]] = [self._SYSTEM_MSG]
+        self._system_tokens: Optional[int] = None
+        self._prompt_key = self.PROMPT_CACHE_KEY
+        if self.custom_rules:
+            self._system_msgs.append({"role": "system", "content": self.custom_rules})
+            self._prompt_key = hashlib.sha256(
+                f"{self.PROMPT_CACHE_KEY}|{self.custom_rules}".encode("utf-8")
+            ).hexdigest()[:16]
+        # Request parameters that are the same for every requirement
+        self._payload_base: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "response_format": self._RESP_FMT
+        }
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(rpm, 60.0) if rpm else None
+        self._token_limiter = RateLimiter(tpm, 60.0) if tpm else None
+        self._api_key = api_key
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._last_request_at: Optional[float] = None
+        if cache is None and cache_path and cache_size > 0:
+            cache = SQLiteResponseCache(cache_path, ttl=cache_ttl, maxsize=cache_size)
+        elif cache is None and cache_size > 0:
+            cache = InMemoryResponseCache(maxsize=cache_size, ttl=cache_ttl)
+        self._cache = cache
+        self._inflight: Dict[str, "asyncio.Future[RequirementSmellResult]"] = {}
+        self.embedding_model = embedding_model
+        self._semantic_cache: Optional[SemanticResponseCache] = None
+        if semantic_cache_threshold:
+            self._semantic_cache = SemanticResponseCache(threshold=semantic_cache_threshold)
+        
+    async def warmup(self, timeout: float = 5.0) -> None:
+        """
+        Open a connection to the OpenAI API ahead of the first analysis.
+        
+        Retrieves the configured model so the TCP/TLS handshake is paid at
+        startup instead of by the first user request. The request is not
+        retried, so a slow or unreachable API fails within `timeout`.
+        
+        Args:
+            timeout: Request timeout in seconds
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        if self.use_aiohttp:
+            # Chat completions go over the aiohttp session, so open that one
+            async with self._get_session().get(
+                f"{str(self.client.base_url).rstrip('/')}/models/{self.model}",
+                headers={"Authorization": f"Bearer {self._api_key}"},
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                await response.read()
+                response.raise_for_status()
+        else:
+            await self.client.with_options(max_retries=0).models.retrieve(self.model, timeout=timeout)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def system_prompt_tokens() -> int:
+        """
+        Count the tokens of SYSTEM_PROMPT, once.
         
+        Counted on first use rather than at import, since loading the
+        tokenizer may download its encoding.
+        """
+        return count_tokens(OpenAIClient.SYSTEM_PROMPT)
+    
+    @property
+    def idle_time(self) -> float:
+        """Seconds since the last chat completion request finished (inf if none has)."""
+        if self._last_request_at is None:
+            return float("inf")
+        return time.monotonic() - self._last_request_at
+    
+    async def aclose(self) -> None:
+        """Close the aiohttp session used by the direct HTTP path, if open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def analyze_requirement(
         self,
         requirement_text: str,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        include_raw: bool = True
     ) -> RequirementSmellResult:
         """
         Analyze a requirement using OpenAI Chat API.
@@ -148,130 +397,1016 @@ Analyze the requirement and return a JSON object with:
         Args:
             requirement_text: The requirement text to analyze
             timeout: Request timeout in seconds
+            include_raw: Include raw_output (model and token usage) in the result
             
         Returns:
             RequirementSmellResult with detected smells
             
         Raises:
-            ValueError: If the requirement text is empty
+            ValueError: If the requirement text is empty or too long
             Exception: If the API request fails
         """
         if not requirement_text or not requirement_text.strip():
             raise ValueError("Requirement text cannot be empty")
+        
+        n_tokens = count_tokens(requirement_text.strip(), self.model)
+        too_short = self._check_length(requirement_text, n_tokens)
+        if too_short is not None:
+            return too_short
             
-        logger.info(f"Analyzing requirement with OpenAI model: {self.model}")
+        cache_key = self._cache_key(requirement_text)
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            logger.info("Returning cached analysis for model: %s", self.model)
+            return cached if include_raw else self._without_raw(cached)
+        
+        # Coalesce concurrent analyses of the same requirement into one API
+        # call. The call runs as its own task and is shielded, so cancelling
+        # one caller does not cancel it for the others.
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._request_analysis(requirement_text, timeout, cache_key, n_tokens)
+            )
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda task: self._finish_inflight(cache_key, task))
+        else:
+            logger.info("Joining in-flight analysis for model: %s", self.model)
+        
+        # The result is shared by every coalesced caller and the caches, so
+        # each caller gets its own copy
+        result = await asyncio.shield(inflight)
+        return result.model_copy(deep=True) if include_raw else self._without_raw(result)
+    
+    @staticmethod
+    def _without_raw(result: RequirementSmellResult) -> RequirementSmellResult:
+        """Copy a (possibly shared) result without its raw_output."""
+        return result.model_copy(update={"raw_output": None})
+    
+    async def _get_cached(self, cache_key: str) -> Optional[RequirementSmellResult]:
+        """
+        Look up a cached result.
+        
+        Args:
+            cache_key: Cache key for the requirement
+            
+        Returns:
+            A deep copy of the cached result, so callers cannot modify the
+            cached entry, or None on a miss
+        """
+        if self._cache is None:
+            return None
+        cached = await self._cache.get(cache_key)
+        return cached.model_copy(deep=True) if cached is not None else None
+    
+    def _finish_inflight(self, cache_key: str, task: "asyncio.Future[RequirementSmellResult]") -> None:
+        """Forget a finished in-flight analysis."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _request_analysis(
+        self,
+        requirement_text: str,
+        timeout: float,
+        cache_key: str,
+        n_tokens: Optional[int] = None
+    ) -> RequirementSmellResult:
+        """
+        Call the OpenAI API for a requirement and cache the parsed result.
+        
+        Args:
+            requirement_text: The requirement text to analyze
+            timeout: Request timeout in seconds
+            cache_key: Cache key for the requirement
+            n_tokens: Token count of the requirement text, if already known
+            
+        Returns:
+            RequirementSmellResult with detected smells
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        embedding: Optional[List[float]] = None
+        if self._semantic_cache is not None:
+            embedding = await self._embed(requirement_text, timeout)
+            similar = None
+            if embedding:
+                # The scan is CPU bound; keep it off the event loop
+                similar = await asyncio.to_thread(self._semantic_cache.lookup, embedding)
+            if similar is not None:
+                logger.info("Reusing analysis of a similar requirement for model: %s", self.model)
+                if self._cache is not None:
+                    await self._cache.set(cache_key, similar)
+                return similar
+        
+        logger.info("Analyzing requirement with OpenAI model: %s", self.model)
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": f"Analyze this requirement:\n\n{requirement_text}"}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-                timeout=timeout
+            content, usage_data = await self._chat(
+                self._completion_body(requirement_text), timeout, n_tokens
             )
+            result = await self._build_result(content, usage_data)
+            if self._cache is not None:
+                await self._cache.set(cache_key, result)
+            if self._semantic_cache is not None and embedding:
+                self._semantic_cache.add(embedding, result)
+            return result
             
-            # Extract the response content
-            content = response.choices[0].message.content
-            logger.debug(f"OpenAI raw response: {content}")
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse OpenAI JSON response: %s", e)
+            # Return error as smell
+            return self._parse_error_result(e)
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+            raise
+    
+    async def _chat(
+        self,
+        body: Dict[str, Any],
+        timeout: float,
+        text_tokens: Optional[int] = None
+    ) -> Tuple[str, Optional[Dict[str, int]]]:
+        """
+        Send a chat completion request within the client's concurrency and
+        rate limits.
+        
+        Args:
+            body: Request body from _completion_body()
+            timeout: Request timeout in seconds
+            text_tokens: Token count of the requirement text, if already known
             
-            # Parse JSON response
-            result_data = json.loads(content)
+        Returns:
+            Tuple of (response content, token usage)
+        """
+        if self.service_tier:
+            body["service_tier"] = self.service_tier
+        
+        async with self._semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            if self._token_limiter is not None:
+                await self._token_limiter.acquire(self._estimate_tokens(body, text_tokens))
+            try:
+                if self.use_aiohttp:
+                    content, usage_data = await self._raw_chat(body, timeout)
+                elif self.stream:
+                    # The SDK timeout applies to each read, so a slowly
+                    # streamed response is bounded as a whole here
+                    content, usage_data = await asyncio.wait_for(
+                        self._stream_chat(body, timeout), timeout
+                    )
+                else:
+                    content, usage_data = await self._sdk_chat(body, timeout)
+            finally:
+                self._last_request_at = time.monotonic()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OpenAI raw response: %s", content)
+        return content, usage_data
+    
+    def _estimate_tokens(self, body: Dict[str, Any], text_tokens: Optional[int] = None) -> int:
+        """
+        Estimate the tokens a request counts against the rate limit.
+        
+        OpenAI counts the prompt plus max_tokens, whatever the actual
+        completion length.
+        
+        Args:
+            body: Request body from _completion_body()
+            text_tokens: Token count of the requirement text, if already
+                known; the user message is encoded otherwise
             
-            smells = result_data.get("smells", [])
-            explanation = result_data.get("explanation", None)
+        Returns:
+            Estimated token count
+        """
+        if self._system_tokens is None:
+            self._system_tokens = self.system_prompt_tokens()
+            if self.custom_rules:
+                self._system_tokens += count_tokens(self.custom_rules, self.model)
+        if text_tokens is None:
+            user_tokens = count_tokens(body["messages"][-1]["content"], self.model)
+        else:
+            user_tokens = text_tokens + self.USER_PREFIX_TOKENS
+        return self._system_tokens + user_tokens + body["max_tokens"]
+    
+    def _sync_rate_limits(self, headers: Mapping[str, str]) -> None:
+        """
+        Align the rate limiters with the limits reported by OpenAI.
+        
+        Args:
+            headers: Response headers of a chat completion request
+        """
+        for limiter, kind in ((self._rate_limiter, "requests"), (self._token_limiter, "tokens")):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if limiter is None or remaining is None:
+                continue
+            try:
+                limiter.sync(float(remaining), parse_reset(headers.get(f"x-ratelimit-reset-{kind}")))
+            except ValueError:
+                logger.debug("Ignoring malformed x-ratelimit-remaining-%s header: %s", kind, remaining)
+    
+    async def _sdk_chat(
+        self,
+        body: Dict[str, Any],
+        timeout: float
+    ) -> Tuple[str, Optional[Dict[str, int]]]:
+        """
+        Send a chat completion request through the OpenAI SDK.
+        
+        Args:
+            body: Request body from _completion_body()
+            timeout: Request timeout in seconds
             
-            # Normalize smell names
-            normalized_smells = [self._normalize_smell(smell) for smell in smells]
+        Returns:
+            Tuple of (response content, token usage)
+        """
+        raw_response = await self.client.chat.completions.with_raw_response.create(
+            **body,
+            extra_body={"prompt_cache_key": self.PROMPT_CACHE_KEY},
+            timeout=timeout
+        )
+        self._sync_rate_limits(raw_response.headers)
+        response = raw_response.parse()
+        
+        # Extract the response content
+        content = response.choices[0].message.content or ""
+        
+        usage = response.usage
+        if usage and usage.prompt_tokens_details:
+            logger.debug(
+                "OpenAI prompt cache: %s/%s prompt tokens cached",
+                usage.prompt_tokens_details.cached_tokens, usage.prompt_tokens
+            )
+        usage_data = self._usage_data(usage) if usage else None
+        
+        return content, usage_data
+    
+    async def _stream_chat(
+        self,
+        body: Dict[str, Any],
+        timeout: float
+    ) -> Tuple[str, Optional[Dict[str, int]]]:
+        """
+        Send a streaming chat completion request through the OpenAI SDK.
+        
+        Content deltas are collected as they arrive; token usage comes in
+        the final chunk. The stream is closed however reading ends (including
+        cancellation by the overall timeout), releasing its pooled connection.
+        
+        Args:
+            body: Request body from _completion_body()
+            timeout: Request timeout in seconds
             
-            return RequirementSmellResult(
-                smells=normalized_smells,
-                explanation=explanation,
+        Returns:
+            Tuple of (response content, token usage)
+        """
+        raw_response = await self.client.chat.completions.with_raw_response.create(
+            **body,
+            stream=True,
+            stream_options={"include_usage": True},
+            extra_body={"prompt_cache_key": self.PROMPT_CACHE_KEY},
+            timeout=timeout
+        )
+        self._sync_rate_limits(raw_response.headers)
+        stream = raw_response.parse()
+        
+        parts: List[str] = []
+        usage_data: Optional[Dict[str, int]] = None
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                if chunk.usage:
+                    usage_data = self._usage_data(chunk.usage)
+        
+        return "".join(parts), usage_data
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session for the direct HTTP path, opening it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=200,
+                    keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def _raw_chat(
+        self,
+        body: Dict[str, Any],
+        timeout: float
+    ) -> Tuple[str, Optional[Dict[str, int]]]:
+        """
+        POST a chat completion request directly with aiohttp.
+        
+        Bypasses the SDK's httpx transport, which scales poorly at high
+        request concurrency. Uses a session shared by all requests of
+        this client.
+        
+        Note: Unlike the SDK, this path does not retry 429 or 5xx
+        responses; they are raised immediately.
+        
+        Args:
+            body: Request body from _completion_body()
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Tuple of (response content, token usage)
+            
+        Raises:
+            RuntimeError: If the API returns an error status (the response
+                body is not parsed, as gateway errors are often HTML)
+        """
+        async with self._get_session().post(
+            f"{str(self.client.base_url).rstrip('/')}/chat/completions",
+            headers={"Authorization": f"Bearer {self._api_key}"},
+            json={**body, "prompt_cache_key": self.PROMPT_CACHE_KEY},
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            self._sync_rate_limits(response.headers)
+            if response.status != 200:
+                detail = await response.text()
+                raise RuntimeError(f"OpenAI API returned {response.status}: {detail[:500]}")
+            data = await response.json(content_type=None)
+        
+        content = data["choices"][0]["message"]["content"] or ""
+        usage = data.get("usage")
+        if usage and usage.get("prompt_tokens_details"):
+            logger.debug(
+                "OpenAI prompt cache: %s/%s prompt tokens cached",
+                usage["prompt_tokens_details"].get("cached_tokens"), usage["prompt_tokens"]
+            )
+        usage_data = self._usage_data_from_json(usage) if usage else None
+        
+        return content, usage_data
+    
+    async def analyze_many(
+        self,
+        requirement_texts: List[str],
+        concurrency: int = 20,
+        timeout: float = 30.0
+    ) -> List[Union[RequirementSmellResult, BaseException]]:
+        """
+        Analyze many requirements concurrently.
+        
+        Up to `concurrency` analyses run at once, on top of the client's
+        own max_concurrency and rpm limits. A failure affects only its own
+        requirement. Repeated texts are analyzed once and take up a single
+        concurrency slot.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            concurrency: Maximum analyses in progress at once
+            timeout: Request timeout in seconds for each requirement
+            
+        Returns:
+            One entry per requirement, in input order: its result, or the
+            exception raised while analyzing it
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(requirement_text: str) -> RequirementSmellResult:
+            async with semaphore:
+                return await self.analyze_requirement(requirement_text, timeout)
+        
+        unique_texts = list(dict.fromkeys(requirement_texts))
+        unique_results = await asyncio.gather(
+            *[analyze_one(text) for text in unique_texts],
+            return_exceptions=True
+        )
+        by_text = dict(zip(unique_texts, unique_results))
+        
+        # Later duplicates get their own copy, as they would from the cache
+        results: List[Union[RequirementSmellResult, BaseException]] = []
+        seen = set()
+        for text in requirement_texts:
+            result = by_text[text]
+            if text in seen and isinstance(result, RequirementSmellResult):
+                result = result.model_copy(deep=True)
+            seen.add(text)
+            results.append(result)
+        return results
+    
+    async def analyze_requirements_grouped(
+        self,
+        requirement_texts: List[str],
+        group_size: int = 8,
+        timeout: float = 60.0
+    ) -> List[RequirementSmellResult]:
+        """
+        Analyze many requirements, several per chat completion request.
+        
+        Requirements are sent as a numbered list in one user message, so the
+        system prompt is paid once per group instead of once per
+        requirement. Requirements the model skips or answers malformed are
+        re-analyzed one at a time. Cached requirements are not resent.
+        
+        Note: Token usage in raw_output covers the whole group request.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            group_size: Requirements per request; larger groups save more
+                prompt tokens but need proportionally more output tokens
+            timeout: Request timeout in seconds for each group
+            
+        Returns:
+            One RequirementSmellResult per requirement, in input order
+            
+        Raises:
+            ValueError: If any requirement text is empty or too long
+            Exception: If an API request fails
+        """
+        if any(not text or not text.strip() for text in requirement_texts):
+            raise ValueError("Requirement text cannot be empty")
+        
+        results: List[Optional[RequirementSmellResult]] = [
+            self._check_length(text) for text in requirement_texts
+        ]
+        cache_keys = [self._cache_key(text) for text in requirement_texts]
+        for index, cache_key in enumerate(cache_keys):
+            if results[index] is None:
+                results[index] = await self._get_cached(cache_key)
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        groups = [pending[i:i + group_size] for i in range(0, len(pending), group_size)]
+        group_results = await asyncio.gather(*[
+            self._analyze_group([requirement_texts[index] for index in group], timeout)
+            for group in groups
+        ])
+        
+        missed: List[int] = []
+        for group, parsed in zip(groups, group_results):
+            for index, result in zip(group, parsed):
+                if result is None:
+                    missed.append(index)
+                    continue
+                if self._cache is not None:
+                    await self._cache.set(cache_keys[index], result.model_copy(deep=True))
+                results[index] = result
+        
+        # Fall back to single requests for anything the groups missed
+        fallbacks = await asyncio.gather(*[
+            self.analyze_requirement(requirement_texts[index], timeout)
+            for index in missed
+        ])
+        for index, result in zip(missed, fallbacks):
+            results[index] = result
+        
+        return [result for result in results if result is not None]
+    
+    async def _analyze_group(
+        self,
+        requirement_texts: List[str],
+        timeout: float
+    ) -> List[Optional[RequirementSmellResult]]:
+        """
+        Analyze a group of requirements in one chat completion request.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze together
+            timeout: Request timeout in seconds
+            
+        Returns:
+            One result per requirement, or None where the response had no
+            usable entry for it
+        """
+        if len(requirement_texts) == 1:
+            return [None]
+        
+        numbered = "\n".join(
+            f"REQ {number}: {text.strip()}"
+            for number, text in enumerate(requirement_texts, start=1)
+        )
+        body = self._completion_body(numbered)
+        body["messages"] = [
+            *self._system_msgs,
+            {"role": "user", "content": f"{self.GROUP_INSTRUCTIONS}\n\n{numbered}"}
+        ]
+        body["max_tokens"] = self.max_tokens * len(requirement_texts)
+        
+        logger.info(
+            "Analyzing %d requirements in one request with OpenAI model: %s",
+            len(requirement_texts), self.model
+        )
+        content, usage_data = await self._chat(body, timeout)
+        
+        parsed: List[Optional[RequirementSmellResult]] = [None] * len(requirement_texts)
+        try:
+            entries = self._load_json(content).get("results")
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning("Failed to parse grouped OpenAI response: %s", e)
+            return parsed
+        
+        for entry in entries if isinstance(entries, list) else []:
+            try:
+                position = int(entry["id"]) - 1
+                smells = entry.get("smells") or []
+                explanation = entry.get("explanation")
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            if not 0 <= position < len(parsed) or not isinstance(smells, list):
+                continue
+            if not all(isinstance(smell, str) for smell in smells):
+                continue
+            
+            # Each entry gets its own copy of the usage shared by the request
+            parsed[position] = RequirementSmellResult.model_construct(
+                smells=tuple(self._normalize_batch(smells)),
+                explanation=explanation if explanation is None else str(explanation),
                 raw_output={
                     "model": self.model,
-                    "content": result_data,
-                    "usage": response.usage.model_dump() if response.usage else None
+                    "usage": dict(usage_data) if usage_data is not None else None
+                }
+            )
+        
+        return parsed
+    
+    async def analyze_requirements_batch(
+        self,
+        requirement_texts: List[str],
+        poll_interval: float = 30.0,
+        include_raw: bool = True
+    ) -> List[RequirementSmellResult]:
+        """
+        Analyze many requirements through the OpenAI Batch API.
+        
+        Requests are uploaded as a JSONL file and processed asynchronously
+        by OpenAI within 24 hours at half the price of synchronous calls.
+        Intended for offline analysis of whole documents, not for
+        interactive use. Cached requirements are not resubmitted.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            poll_interval: Seconds before the first batch status check; the
+                interval doubles after each check up to MAX_BATCH_POLL_INTERVAL
+            include_raw: Include raw_output (model and token usage) in the results
+            
+        Returns:
+            One RequirementSmellResult per requirement, in input order
+            
+        Raises:
+            ValueError: If any requirement text is empty or too long
+            RuntimeError: If the batch fails, expires or is cancelled
+            Exception: If an API request fails
+        """
+        if any(not text or not text.strip() for text in requirement_texts):
+            raise ValueError("Requirement text cannot be empty")
+        
+        results: List[Optional[RequirementSmellResult]] = [
+            self._check_length(text) for text in requirement_texts
+        ]
+        cache_keys = [self._cache_key(text) for text in requirement_texts]
+        for index, cache_key in enumerate(cache_keys):
+            if results[index] is None:
+                results[index] = await self._get_cached(cache_key)
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            batch_id = await self.submit_batch(
+                [requirement_texts[index] for index in pending],
+                custom_ids=[str(index) for index in pending]
+            )
+            
+            # Batches take minutes to hours; back off so long runs poll rarely
+            delay = poll_interval
+            collected = await self.collect_batch(batch_id)
+            while collected is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_BATCH_POLL_INTERVAL)
+                collected = await self.collect_batch(batch_id)
+            
+            for custom_id, result in collected.items():
+                index = int(custom_id)
+                results[index] = result
+                # Only successfully parsed results carry the model name
+                if self._cache is not None and result.raw_output and "model" in result.raw_output:
+                    await self._cache.set(cache_keys[index], result.model_copy(deep=True))
+        
+        return [
+            RequirementSmellResult(
+                smells=("analysis_error",),
+                explanation="Analysis failed: no result returned by OpenAI batch",
+                raw_output=None
+            ) if result is None
+            else result if include_raw or result.raw_output is None
+            else self._without_raw(result)
+            for result in results
+        ]
+    
+    async def submit_batch(
+        self,
+        requirement_texts: List[str],
+        custom_ids: Optional[List[str]] = None
+    ) -> str:
+        """
+        Submit requirements to the OpenAI Batch API without waiting.
+        
+        Every text is submitted as given; use analyze_requirements_batch to
+        skip cached and too-short requirements automatically.
+        
+        Args:
+            requirement_texts: The requirement texts to analyze
+            custom_ids: Identifier for each requirement, returned as the keys
+                of collect_batch() (default: list positions as strings)
+            
+        Returns:
+            The OpenAI batch ID
+            
+        Raises:
+            ValueError: If any requirement text is empty or too long, the
+                number of custom IDs does not match, or the batch exceeds
+                the Batch API limits
+            Exception: If an API request fails
+        """
+        if len(requirement_texts) > self.MAX_BATCH_REQUESTS:
+            raise ValueError(
+                f"A batch holds at most {self.MAX_BATCH_REQUESTS} requirements "
+                f"(got {len(requirement_texts)})"
+            )
+        if any(not text or not text.strip() for text in requirement_texts):
+            raise ValueError("Requirement text cannot be empty")
+        if custom_ids is None:
+            custom_ids = [str(index) for index in range(len(requirement_texts))]
+        if len(custom_ids) != len(requirement_texts):
+            raise ValueError("custom_ids must have one entry per requirement")
+        for text in requirement_texts:
+            self._check_length(text)
+        
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **self._completion_body(text),
+                    "prompt_cache_key": self.PROMPT_CACHE_KEY
                 }
+            })
+            for custom_id, text in zip(custom_ids, requirement_texts)
+        ]
+        payload = b"\n".join(lines)
+        if len(payload) > self.MAX_BATCH_FILE_BYTES:
+            raise ValueError(
+                f"Batch input is {len(payload)} bytes, above the "
+                f"{self.MAX_BATCH_FILE_BYTES}-byte limit; submit fewer requirements"
             )
+        batch_file = await self.client.files.create(
+            file=("requirements.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata=self.BATCH_METADATA
+        )
+        logger.info("Submitted OpenAI batch %s with %d requirements", batch.id, len(lines))
+        return batch.id
+    
+    async def collect_batch(self, batch_id: str) -> Optional[Dict[str, RequirementSmellResult]]:
+        """
+        Fetch the results of a submitted batch if it has finished.
+        
+        Args:
+            batch_id: ID returned by submit_batch()
+            
+        Returns:
+            Results keyed by custom ID, or None while the batch is still
+            running. Requests that failed within the batch (listed in its
+            error file) get an "analysis_error" result.
             
+        Raises:
+            LookupError: If no batch with this ID was submitted by submit_batch()
+            RuntimeError: If the batch failed, expired or was cancelled
+            Exception: If an API request fails
+        """
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+        except NotFoundError:
+            raise LookupError(f"OpenAI batch {batch_id} not found")
+        # Other batches in the account (fine-tuning data, other tools) are
+        # not ours to read
+        metadata = batch.metadata if isinstance(batch.metadata, dict) else {}
+        if any(metadata.get(key) != value for key, value in self.BATCH_METADATA.items()):
+            raise LookupError(f"OpenAI batch {batch_id} was not submitted by this service")
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+        if batch.status != "completed":
+            return None
+        
+        # Successful requests are written to the output file, failed ones to
+        # the error file, in the same line format
+        results: Dict[str, RequirementSmellResult] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self.client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                item = orjson.loads(line)
+                results[item["custom_id"]] = await self._batch_item_result(item)
+        return results
+    
+    async def _batch_item_result(self, item: Dict[str, Any]) -> RequirementSmellResult:
+        """
+        Convert one line of a batch output file into a result.
+        
+        Args:
+            item: Parsed batch output line
+            
+        Returns:
+            RequirementSmellResult for the requirement
+        """
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            error = item.get("error") or response.get("body", {}).get("error")
+            logger.error("OpenAI batch request %s failed: %s", item.get("custom_id"), error)
+            return RequirementSmellResult(
+                smells=("analysis_error",),
+                explanation=f"Analysis failed: {error}",
+                raw_output=None
+            )
+        
+        body = response["body"]
+        content = body["choices"][0]["message"]["content"] or ""
+        usage = body.get("usage")
+        usage_data = self._usage_data_from_json(usage) if usage else None
+        
+        try:
+            return await self._build_result(content, usage_data)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse OpenAI JSON response: {str(e)}")
-            # Return error as smell
+            logger.error("Failed to parse OpenAI JSON response: %s", e)
+            return self._parse_error_result(e)
+    
+    def _completion_body(self, requirement_text: str) -> Dict[str, Any]:
+        """
+        Build the chat completion request body for a requirement.
+        
+        Args:
+            requirement_text: The requirement text to analyze
+            
+        Returns:
+            Request parameters shared by the synchronous and batch paths
+        """
+        return {
+            **self._payload_base,
+            "messages": [
+                *self._system_msgs,
+                {"role": "user", "content": f"Analyze this requirement:\n\n{requirement_text}"}
+            ]
+        }
+    
+    async def _build_result(
+        self,
+        content: str,
+        usage_data: Optional[Dict[str, int]]
+    ) -> RequirementSmellResult:
+        """
+        Parse a model response into a RequirementSmellResult.
+        
+        Args:
+            content: Raw JSON string returned by the model
+            usage_data: Token counts for the request
+            
+        Returns:
+            RequirementSmellResult with normalized smells
+            
+        Raises:
+            json.JSONDecodeError: If the content is not valid JSON
+        """
+        # Parse JSON response; large payloads are parsed in a worker
+        # thread so they don't block other analyses on the event loop
+        if len(content) > self.PARSE_OFFLOAD_THRESHOLD:
+            normalized_smells, explanation = await asyncio.to_thread(
+                self._parse_content, content
+            )
+        else:
+            normalized_smells, explanation = self._parse_content(content)
+        
+        # Fields are already normalized above, so skip pydantic validation.
+        # The parsed content is not kept in raw_output: smells and
+        # explanation are already first-class fields of the result.
+        return RequirementSmellResult.model_construct(
+            smells=tuple(normalized_smells),
+            explanation=explanation,
+            raw_output={
+                "model": self.model,
+                "usage": usage_data
+            }
+        )
+    
+    def _check_length(
+        self,
+        requirement_text: str,
+        n_tokens: Optional[int] = None
+    ) -> Optional[RequirementSmellResult]:
+        """
+        Validate a requirement's length locally before calling the API.
+        
+        Args:
+            requirement_text: The requirement text to check
+            n_tokens: Token count of the stripped text, if already known
+            
+        Returns:
+            A too_short_sentence result for fragments below
+            MIN_REQUIREMENT_TOKENS, otherwise None
+            
+        Raises:
+            ValueError: If the requirement exceeds max_requirement_tokens
+        """
+        if n_tokens is None:
+            n_tokens = count_tokens(requirement_text.strip(), self.model)
+        if n_tokens > self.max_requirement_tokens:
+            raise ValueError(
+                f"Requirement text is too long ({n_tokens} tokens, "
+                f"maximum {self.max_requirement_tokens})"
+            )
+        if n_tokens < self.MIN_REQUIREMENT_TOKENS:
             return RequirementSmellResult(
-                smells=["parse_error"],
-                explanation="Failed to parse AI response",
-                raw_output={"error": str(e)}
+                smells=("too_short_sentence",),
+                explanation="Requirement is too short to state an actor, action and object",
+                raw_output=None
             )
+        return None
+    
+    @staticmethod
+    def _usage_data(usage: Any) -> Dict[str, int]:
+        """
+        Pick the token counts from an SDK usage object.
+        
+        Reads the fields directly instead of a full model_dump(), and
+        includes cached prompt tokens for monitoring the prompt cache hit rate.
+        """
+        details = usage.prompt_tokens_details
+        return {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+            "cached_tokens": (details.cached_tokens or 0) if details else 0
+        }
+    
+    @staticmethod
+    def _usage_data_from_json(usage: Dict[str, Any]) -> Dict[str, int]:
+        """Pick the token counts from a usage object in a raw JSON response."""
+        details = usage.get("prompt_tokens_details") or {}
+        return {
+            "prompt_tokens": usage["prompt_tokens"],
+            "completion_tokens": usage["completion_tokens"],
+            "total_tokens": usage["total_tokens"],
+            "cached_tokens": details.get("cached_tokens") or 0
+        }
+    
+    @staticmethod
+    def _parse_error_result(error: Exception) -> RequirementSmellResult:
+        """Build the result returned when the model's JSON cannot be parsed."""
+        return RequirementSmellResult(
+            smells=("parse_error",),
+            explanation="Failed to parse AI response",
+            raw_output={"error": str(error)}
+        )
+    
+    async def _embed(self, requirement_text: str, timeout: float) -> Optional[List[float]]:
+        """
+        Embed a requirement for the semantic cache.
+        
+        Args:
+            requirement_text: The requirement text to embed
+            timeout: Request timeout in seconds
+            
+        Returns:
+            The embedding vector, or None if the request failed
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=self.embedding_model,
+                input=requirement_text.strip(),
+                timeout=timeout
+            )
+            return response.data[0].embedding
         except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
-            raise
+            logger.warning("OpenAI embedding failed, skipping semantic cache: %s", e)
+            return None
     
-    def _normalize_smell(self, smell: str) -> str:
+    def _cache_key(self, requirement_text: str) -> str:
+        """
+        Build the content-addressed cache key for a requirement.
+        
+        Args:
+            requirement_text: The requirement text to analyze
+            
+        Returns:
+            Hex digest of the model, temperature, system prompt and custom
+            rules, and stripped requirement text
+        """
+        payload = f"{self.model}|{self.temperature}|{self._prompt_key}|{requirement_text.strip()}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _load_json(content: str) -> Any:
+        """
+        Parse JSON returned by the model.
+        
+        Args:
+            content: Raw JSON string returned by the model
+            
+        Returns:
+            The parsed JSON value
+            
+        Raises:
+            json.JSONDecodeError: If the content contains no valid JSON object
+        """
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # The model occasionally wraps the object in prose; salvage the
+            # object instead of discarding the whole call
+            match = _JSON_RE.search(content)
+            if match is None:
+                raise
+            return orjson.loads(match.group(0))
+    
+    def _parse_content(self, content: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Parse the model's JSON response and normalize the detected smells.
+        
+        Args:
+            content: Raw JSON string returned by the model
+            
+        Returns:
+            Tuple of (normalized smells, explanation)
+            
+        Raises:
+            json.JSONDecodeError: If the content contains no valid JSON object
+        """
+        result_data = self._load_json(content)
+        
+        smells = result_data.get("smells", [])
+        explanation = result_data.get("explanation", None)
+        
+        # Normalize smell names
+        normalized_smells = self._normalize_batch(smells)
+        
+        if explanation is not None and not isinstance(explanation, str):
+            explanation = str(explanation)
+        
+        return normalized_smells, explanation
+    
+    @classmethod
+    def _normalize_batch(cls, smells: Iterable[str]) -> List[str]:
+        """
+        Normalize a list of smell names.
+        
+        Args:
+            smells: Raw smell names from model
+            
+        Returns:
+            Normalized smell names, in the same order
+        """
+        normalize = cls._normalize_smell
+        return [normalize(smell) for smell in smells]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_smell(smell: str) -> str:
         """
         Normalize smell names to consistent format.
         
+        Memoized: models repeat a small set of labels, so after the first
+        occurrence each name costs a single cache lookup.
+        
         Args:
             smell: Raw smell name from model
             
         Returns:
             Normalized smell name in snake_case
         """
-        # Strip backticks (from markdown-style references in prompt)
-        smell = smell.strip('`')
-        
-        # Convert to lowercase and replace spaces/hyphens with underscores
-        normalized = smell.lower().strip().replace(" ", "_").replace("-", "_")
-        
-        # Valid smell labels from our taxonomy (imported from smell_taxonomy.py)
-        valid_smells = set(FLAT_SMELL_LABELS)
-        
-        # Map common variations to standard labels
-        smell_map = {
-            # Legacy mappings for backward compatibility
-            "ambiguous": "vague_or_implicit_terms",
-            "ambiguity": "vague_or_implicit_terms",
-            "unclear": "vague_or_implicit_terms",
-            "weak_verb": "missing_imperative_verb",
-            "weak_verbs": "missing_imperative_verb",
-            "weak_modal": "conditional_or_non_assertive_requirement",
-            "subjective": "subjective_language",
-            "unmeasurable": "non_verifiable_qualifier",
-            "inconsistent": "excessive_or_insufficient_coupling",
-            "inconsistency": "excessive_or_insufficient_coupling",
-            "vague": "vague_or_implicit_terms",
-            "vagueness": "vague_or_implicit_terms",
-            "incomplete": "incomplete_requirement",
-            "incompleteness": "incomplete_requirement",
-            "missing": "incomplete_requirement",
-            
-            # Common alternative phrasings
-            "too_long": "too_long_sentence",
-            "too_short": "too_short_sentence",
-            "readability_issue": "unreadable_structure",
-            "acronym_heavy": "acronym_overuse_or_abbrev",
-            "multiple_concerns": "non_atomic_requirement",
-            "compound_requirement": "non_atomic_requirement",
-            "negative": "negative_formulation",
-            "pronoun_ambiguity": "vague_pronoun_or_reference",
-            "vague_terms": "vague_or_implicit_terms",
-            "no_metrics": "non_verifiable_qualifier",
-            "implementation_detail": "design_or_implementation_detail",
-            "how_not_what": "design_or_implementation_detail",
-            "no_action": "missing_imperative_verb",
-            "conditional": "conditional_or_non_assertive_requirement",
-            "passive": "passive_voice",
-            "jargon_heavy": "domain_term_imbalance",
-            "too_many_refs": "too_many_dependencies_or_versions",
-            "missing_info": "incomplete_requirement",
-            "no_unit": "missing_unit_of_measurement",
-            "grammar_error": "language_error_or_grammar_issue",
-        }
+        # Convert to lowercase, replace spaces/hyphens with underscores and
+        # strip backticks (from markdown-style references in prompt)
+        normalized = smell.translate(_CLEAN_TABLE).strip(_STRIP_CHARS)
         
+        return OpenAIClient._map_smell(normalized)
+    
+    @staticmethod
+    def _map_smell(normalized: str) -> str:
+        """
+        Map a normalized smell name onto the official taxonomy label.
+        
+        Args:
+            normalized: Smell name already in snake_case
+            
+        Returns:
+            Taxonomy label if a mapping exists, otherwise the input unchanged
+        """
         # Try to map to standard label
-        mapped = smell_map.get(normalized, normalized)
+        mapped = _SMELL_MAP.get(normalized, normalized)
         
         # Return mapped if valid, otherwise return normalized
-        return mapped if mapped in valid_smells else normalized
+        return mapped if mapped in FLAT_SMELL_SET else normalized
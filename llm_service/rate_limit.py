@@ -0,0 +1,123 @@
+"""
+Rate Limiting
+Client-side request rate limiting for OpenAI API calls.
+"""
+
+import asyncio
+import re
+import time
+from types import TracebackType
+from typing import Optional, Type
+
+
+# One component of a rate limit reset duration, e.g. "6m", "0.5s" or "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an OpenAI x-ratelimit-reset-* header value.
+    
+    Args:
+        value: Duration such as "1s", "6m0s" or "20ms"
+    
+    Returns:
+        The duration in seconds, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class RateLimiter:
+    """
+    Async token bucket allowing `max_rate` acquisitions per `time_period`.
+    
+    Up to max_rate requests may start back to back; after that, requests
+    are spaced out evenly as capacity refills. Keeping below the account's
+    requests-per-minute limit avoids 429 responses and the SDK's
+    exponential backoff, which stall throughput far more than waiting here.
+    
+    The same class budgets tokens per minute by acquiring a request's
+    estimated token count instead of 1. Calling sync() with the limits
+    OpenAI reports in its response headers keeps the bucket from running
+    ahead of the account-wide budget shared with other processes.
+    
+    Usage:
+        limiter = RateLimiter(500, 60.0)
+        async with limiter:
+            await client.chat.completions.create(...)
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_rate: Requests allowed per time period
+            time_period: Length of the period in seconds
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = float(max_rate)
+        self._last_refill = time.monotonic()
+    
+    def _refill(self) -> None:
+        """Add the capacity regained since the last refill."""
+        now = time.monotonic()
+        self._level = min(
+            float(self.max_rate),
+            self._level + (now - self._last_refill) * self._rate_per_sec
+        )
+        self._last_refill = now
+    
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until a request may start, then claim capacity for it.
+        
+        Args:
+            amount: Capacity the request uses (capped at max_rate)
+        """
+        amount = min(float(amount), float(self.max_rate))
+        while True:
+            self._refill()
+            if self._level >= amount:
+                self._level -= amount
+                return
+            await asyncio.sleep((amount - self._level) / self._rate_per_sec)
+    
+    def sync(self, remaining: float, reset: Optional[float] = None) -> None:
+        """
+        Lower the available capacity to what the server reports.
+        
+        The bucket only ever shrinks here; refilling stays time based.
+        
+        Args:
+            remaining: Capacity left according to the server
+            reset: Seconds until the server's limit fully resets, used to
+                hold off further requests once nothing remains
+        """
+        self._refill()
+        self._level = min(self._level, float(remaining))
+        if remaining < 1 and reset:
+            self._level = min(self._level, 1.0 - reset * self._rate_per_sec)
+    
+    async def __aenter__(self) -> None:
+        await self.acquire()
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        return None
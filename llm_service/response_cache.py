@@ -0,0 +1,296 @@
+"""
+Response Cache
+Caches requirement analysis results so repeated requirements skip the LLM call.
+"""
+
+import asyncio
+import math
+import operator
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import orjson
+
+from llm_service.models.requirement_smell_result import RequirementSmellResult
+
+
+class ResponseCache(ABC):
+    """
+    Interface for analysis result caches.
+    
+    Methods are async so that backends shared between worker processes
+    (e.g. Redis) can be plugged in without changing the client.
+    """
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[RequirementSmellResult]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Cache key for the analysis
+        
+        Returns:
+            The cached result, or None on a miss
+        """
+    
+    @abstractmethod
+    async def set(self, key: str, result: RequirementSmellResult) -> None:
+        """
+        Store a result.
+        
+        Args:
+            key: Cache key for the analysis
+            result: The analysis result to cache
+        """
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Per-process LRU cache with optional time-to-live.
+    
+    Entries are evicted least-recently-used first once maxsize is reached,
+    and expire ttl seconds after being stored.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = 86_400.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds an entry stays valid (None or 0 = never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self._entries: "OrderedDict[str, Tuple[Optional[float], RequirementSmellResult]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[RequirementSmellResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return result
+    
+    async def set(self, key: str, result: RequirementSmellResult) -> None:
+        if self.maxsize <= 0:
+            return
+        
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Persistent cache stored in a SQLite database file.
+    
+    Survives process restarts, so an interrupted analysis of a large
+    document resumes from the requirements already analyzed instead of
+    paying for them again. Database access runs in a worker thread to keep
+    the event loop free.
+    
+    Expired entries are deleted when read and whenever the table grows past
+    maxsize, which also evicts the oldest entries.
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[float] = 86_400.0,
+        maxsize: int = 10_000
+    ):
+        """
+        Initialize the cache, creating the database file if needed.
+        
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds an entry stays valid (None or 0 = never expires)
+            maxsize: Maximum number of stored results (oldest evicted first)
+        """
+        self.path = Path(path)
+        self.ttl = ttl or None
+        self.maxsize = maxsize
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, result BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)"
+            )
+            self._size = self._prune()
+    
+    def _prune(self) -> int:
+        """
+        Delete expired entries, then the oldest ones beyond maxsize.
+        
+        Evicts down to 90% of maxsize, so a full cache is not pruned on
+        every write. Must be called with the lock held, inside a transaction.
+        
+        Returns:
+            Number of entries left
+        """
+        if self.ttl is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at <= ?", (time.time() - self.ttl,)
+            )
+        (size,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if size > self.maxsize:
+            keep = self.maxsize - self.maxsize // 10
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY created_at LIMIT ?)",
+                (size - keep,)
+            )
+            size = keep
+        return size
+    
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            result, created_at = row
+            if self.ttl is not None and created_at + self.ttl <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return result
+    
+    def _set(self, key: str, payload: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, result, created_at) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            # Counts replaced keys too, which only brings the next prune forward
+            self._size += 1
+            if self._size > self.maxsize:
+                self._size = self._prune()
+    
+    async def get(self, key: str) -> Optional[RequirementSmellResult]:
+        payload = await asyncio.to_thread(self._get, key)
+        if payload is None:
+            return None
+        
+        data = orjson.loads(payload)
+        data["smells"] = tuple(data["smells"])
+        return RequirementSmellResult.model_construct(**data)
+    
+    async def set(self, key: str, result: RequirementSmellResult) -> None:
+        payload = orjson.dumps(result.model_dump(mode="json"))
+        await asyncio.to_thread(self._set, key, payload)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticResponseCache:
+    """
+    Nearest-neighbour cache over requirement embeddings.
+    
+    Returns the result of a previously analyzed requirement whose embedding
+    has cosine similarity of at least `threshold` with the query, so
+    paraphrased requirements can skip the LLM call. Lookups scan all
+    entries in pure Python (tens of milliseconds at maxsize with 1536-dim
+    embeddings), so call lookup() from a worker thread rather than on
+    the event loop; it is safe to run alongside add().
+    
+    Note: Small wording changes can flip a requirement's smells (e.g.
+    "shall" vs "may"), so thresholds below ~0.95 risk returning results
+    for requirements that only look alike.
+    """
+    
+    def __init__(self, threshold: float = 0.97, maxsize: int = 1_000):
+        """
+        Initialize the cache.
+        
+        Args:
+            threshold: Minimum cosine similarity for a hit (0.0-1.0)
+            maxsize: Maximum number of stored embeddings (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[Tuple[float, ...], RequirementSmellResult]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> Tuple[float, ...]:
+        """Scale an embedding to unit length so dot products are cosines."""
+        norm = math.sqrt(sum(map(operator.mul, embedding, embedding)))
+        if norm == 0.0:
+            return tuple(embedding)
+        return tuple(x / norm for x in embedding)
+    
+    def lookup(self, embedding: Sequence[float]) -> Optional[RequirementSmellResult]:
+        """
+        Find the stored result most similar to an embedding.
+        
+        Args:
+            embedding: Embedding of the requirement being analyzed
+            
+        Returns:
+            The most similar cached result at or above the threshold, else None
+        """
+        query = self._unit(embedding)
+        best_score = self.threshold
+        best: Optional[RequirementSmellResult] = None
+        
+        with self._lock:
+            entries = list(self._entries.values())
+        
+        for vector, result in entries:
+            score = sum(map(operator.mul, query, vector))
+            if score >= best_score:
+                best_score = score
+                best = result
+        
+        return best
+    
+    def add(self, embedding: Sequence[float], result: RequirementSmellResult) -> None:
+        """
+        Store the result for an embedded requirement.
+        
+        Args:
+            embedding: Embedding of the analyzed requirement
+            result: The analysis result
+        """
+        if self.maxsize <= 0:
+            return
+        
+        vector = self._unit(embedding)
+        with self._lock:
+            self._entries[self._next_id] = (vector, result)
+            self._next_id += 1
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -12,16 +12,23 @@ The flat list (FLAT_SMELL_LABELS) is the single source of truth for all:
 - API schemas
 
 The taxonomy block (TAXONOMY_TEXT) provides the structured documentation for:
-- LLM system prompts (primary and judge)
+- LLM system prompts (judge)
 - Human-readable documentation
 - Research papers
 
+The compact taxonomy (TAXONOMY_COMPACT) is derived from TAXONOMY_TEXT with one
+"id: definition" line per smell and no category headings (notes are kept),
+for the primary analysis prompt that is sent with every request.
+
 References:
 - Alemneh & Berhanu (2024): Software Requirement Smells and Detection Techniques: A Systematic Literature Review
 - Paska: Automated Smell Detection and Recommendation in Natural Language Requirements
 - ISO/IEC 29148: Systems and software engineering — Requirements engineering
 """
 
+import re
+
+
 # Flat list of smell IDs - use these exact strings everywhere in code
 FLAT_SMELL_LABELS = [
     # Morphological
@@ -69,6 +76,9 @@ FLAT_SMELL_LABELS = [
     "ambiguous_plurality",
 ]
 
+# Set view of FLAT_SMELL_LABELS for constant-time membership checks
+FLAT_SMELL_SET = frozenset(FLAT_SMELL_LABELS)
+
 # Taxonomy documentation for prompts and human consumption
 TAXONOMY_TEXT = """
 Taxonomy of requirement smells
@@ -129,11 +139,21 @@ Incompleteness & language errors — missing information
 - `ambiguous_plurality` – Unclear whether the requirement applies to one, some, or all instances (e.g., "the system shall show errors on screens" with unclear scope of "screens").
 """.strip()
 
+# Compact taxonomy for the primary analysis prompt: the same definitions as
+# TAXONOMY_TEXT, without the category headings; notes such as the one on
+# relational smells are kept in place, since they guide detection
+TAXONOMY_COMPACT = "Valid smell IDs and definitions:\n" + "\n".join(
+    f"- {smell_id}: {definition}" if smell_id else note
+    for smell_id, definition, note in re.findall(
+        r"^(?:- `(\w+)` – (.+)|(\(.+\)))$", TAXONOMY_TEXT, re.MULTILINE
+    )
+)
+
 
 # Helper function to validate smell labels
 def is_valid_smell(smell: str) -> bool:
     """Check if a smell label is in the official taxonomy."""
-    return smell in FLAT_SMELL_LABELS
+    return smell in FLAT_SMELL_SET
 
 
 def validate_smells(smells: list[str]) -> tuple[list[str], list[str]]:
@@ -146,6 +166,8 @@ def validate_smells(smells: list[str]) -> tuple[list[str], list[str]]:
     Returns:
         Tuple of (valid_smells, invalid_smells)
     """
-    valid = [s for s in smells if is_valid_smell(s)]
-    invalid = [s for s in smells if not is_valid_smell(s)]
+    valid: list[str] = []
+    invalid: list[str] = []
+    for s in smells:
+        (valid if s in FLAT_SMELL_SET else invalid).append(s)
     return valid, invalid
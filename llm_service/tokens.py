@@ -0,0 +1,100 @@
+"""
+Token Counting
+Local token counts for validating requirements before they are sent to OpenAI.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List
+
+import tiktoken
+
+
+logger = logging.getLogger(__name__)
+
+# Encoding used for models tiktoken does not know (e.g. fine-tuned model IDs)
+DEFAULT_ENCODING = "o200k_base"
+
+# Rough characters-per-token ratio for English text, used when no encoding
+# can be loaded (tiktoken downloads its encodings on first use)
+CHARS_PER_TOKEN = 4
+
+
+# Seconds before retrying an encoding that failed to load, so a transient
+# download failure does not leave counts approximate for the process lifetime
+RETRY_INTERVAL = 300.0
+
+# Loaded encode functions by model; failed loads are not cached here
+_encoders: Dict[str, Callable[[str], List[int]]] = {}
+_failed_at: Dict[str, float] = {}
+
+
+def _encoder_for(model: str) -> Callable[[str], List[int]]:
+    """
+    Get the tiktoken encode function for a model.
+    
+    Fine-tuned models ("ft:gpt-4o-mini:org:...") are resolved via their
+    base model name. If the encoding cannot be loaded, an approximate
+    encoder is used and loading is retried after RETRY_INTERVAL.
+    
+    Args:
+        model: OpenAI model name
+    
+    Returns:
+        The encoding's encode function, or an approximate encoder if the
+        encoding cannot be loaded
+    """
+    encoder = _encoders.get(model)
+    if encoder is not None:
+        return encoder
+    failed_at = _failed_at.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < RETRY_INTERVAL:
+        return _approximate_encode
+    base_model = model.split(":")[1] if model.startswith("ft:") else model
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(base_model)
+        except KeyError:
+            encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        _failed_at[model] = time.monotonic()
+        logger.warning("Could not load tiktoken encoding for %s, estimating token counts: %s", model, e)
+        return _approximate_encode
+    _failed_at.pop(model, None)
+    _encoders[model] = encoding.encode_ordinary
+    return encoding.encode_ordinary
+
+
+def load_encoding(model: str) -> bool:
+    """
+    Load a model's encoding ahead of the first count.
+    
+    Loading may download the encoding, so call this from a worker thread
+    in async code.
+    
+    Args:
+        model: OpenAI model name
+    
+    Returns:
+        True if the encoding loaded, False if counts will be approximate
+    """
+    return _encoder_for(model) is not _approximate_encode
+
+
+def _approximate_encode(text: str) -> List[int]:
+    """Stand-in encoder producing one pseudo-token per CHARS_PER_TOKEN characters."""
+    return [0] * -(-len(text) // CHARS_PER_TOKEN)
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """
+    Count the tokens a text uses with a model's encoding.
+    
+    Args:
+        text: Text to count
+        model: OpenAI model name
+    
+    Returns:
+        Number of tokens
+    """
+    return len(_encoder_for(model)(text))
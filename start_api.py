@@ -22,6 +22,7 @@ if __name__ == "__main__":
     print(f"🌐 API URL: http://{settings.API_HOST}:{settings.API_PORT}")
     print(f"📚 API Docs: http://{settings.API_HOST}:{settings.API_PORT}/docs")
     print(f"🔍 Health Check: http://{settings.API_HOST}:{settings.API_PORT}/health")
+    print(f"⚙️  Workers: {1 if settings.API_RELOAD else settings.API_WORKERS}")
     print("=" * 60)
     
     uvicorn.run(
@@ -29,5 +30,6 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.API_RELOAD,
+        workers=None if settings.API_RELOAD else settings.API_WORKERS,
         log_level=settings.LOG_LEVEL.lower()
     )